@@ -0,0 +1,67 @@
+# std library
+import os
+import sys
+import time
+# third-party
+import numpy as np
+# local
+import solution
+import solution_np
+
+'''
+Times the original readlines() path against the memory-mapped numpy engine on a generated inventory file.
+
+    python benchmark.py [size in MB]    (default: 2048 MB)
+
+Note: the readlines() path holds the entire file as Python objects, so it needs several times the file size in RAM.
+'''
+
+BENCHMARK_FILE = 'benchmark_input.txt'
+DEFAULT_SIZE_MB = 2048
+
+def generate_inventory_file(outputfile, size_mb, seed=2022):
+    '''Writes random elves (1-10 items, 1-5 digit calories) until the file reaches size_mb.
+    One block of elves is generated up front and written repeatedly, which keeps generation fast.
+    '''
+    rng = np.random.default_rng(seed)
+    elves = []
+    for _ in range(200_000):
+        items = rng.integers(1, 100_000, size=rng.integers(1, 11))
+        elves.append('\n'.join(map(str, items)))
+    block = ('\n\n'.join(elves) + '\n\n').encode()
+
+    target_size = size_mb * (1 << 20)
+    with open(outputfile, 'wb') as f:
+        written = 0
+        while written < target_size:
+            f.write(block)
+            written += len(block)
+
+def readlines_path(inputfile):
+    elf_list = solution.read_input_file_into_elf_list(inputfile)
+    elf_total_calorie_list = [sum(food_list) for food_list in elf_list]
+    elf_total_calorie_list.sort(reverse=True)
+    return elf_total_calorie_list[0], sum(elf_total_calorie_list[:3])
+
+def parallel_path(inputfile):
+    top_three = solution.parallel_top_k_elf_totals(inputfile, k=3)
+    return top_three[0], sum(top_three)
+
+def time_fn(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE_MB
+    print(f'generating {size_mb} MB inventory file...')
+    generate_inventory_file(BENCHMARK_FILE, size_mb)
+    try:
+        for name, fn in [('readlines()', readlines_path),
+                         ('streaming top-K', solution.part_one_and_two),
+                         ('numpy mmap + reduceat', solution_np.part_one_and_two),
+                         (f'parallel ({os.cpu_count()} procs)', parallel_path)]:
+            result, elapsed = time_fn(fn, BENCHMARK_FILE)
+            print(f'{name:>22}: {elapsed:8.2f} s   {size_mb / elapsed:8.1f} MB/s   answers: {result}')
+    finally:
+        os.remove(BENCHMARK_FILE)
@@ -2,9 +2,21 @@
 # import requests
 # url = r"https://adventofcode.com/2022/day/1/input"
 # r = requests.get(url)
+import hashlib
+import heapq
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import time
 from pprint import pprint
 
-inputfile = "input.txt"
+# follow mode -- keep watching input file as it grows, only processing appended bytes
+FOLLOW_MODE = False
+CHECKPOINT_FILE = 'input_checkpoint.json'
+BLANK_LINE = re.compile(rb'\n\r?\n')  # the end of a line, then an empty line -- LF or CRLF
+FINGERPRINT_SIZE = 4096  # bytes just before the checkpoint offset that get hashed, to notice a replaced input file
 
 '''
 parsing rules:
@@ -12,24 +24,213 @@ each line represents calories of a particular food item carried by an elf
 elves can carry 1+ food items
 delineation between elves = newline
 '''
-elf_list = []
-buffer = []
-
-with open(inputfile, 'r') as inputfile:
-    for line in inputfile.readlines():
-        if line == '\n':
-            elf_list.append([int(item) for item in buffer])  # str -> int calories
-            buffer.clear()  # empty out, start anew
-            continue
-        buffer.append(line.replace('\n', ''))
-    # once the file has been read, need to put last elf's items into list 
-    else:
-        elf_list.append([int(item) for item in buffer])
-
-# PART ONE loop over elves and find max calories
-elf_total_calorie_list = [sum(food_list) for food_list in elf_list]
-elf_total_calorie_list.sort(reverse=True)
-print(f'Elf with most calories is carrying: {elf_total_calorie_list[0]}')
-
-# PART TWO find sum of top 3 elf calories
-print(f'Total calories of top 3 elves carrying most calories: {sum(elf_total_calorie_list[:3])}')
\ No newline at end of file
+
+def read_input_file_into_elf_list(inputfile):
+    '''Original parser -- reads the whole file and keeps every elf's list of item calories.'''
+    elf_list = []
+    buffer = []
+
+    with open(inputfile, 'r') as _inputfile:
+        for line in _inputfile.readlines():
+            if line == '\n':
+                elf_list.append([int(item) for item in buffer])  # str -> int calories
+                buffer.clear()  # empty out, start anew
+                continue
+            buffer.append(line.replace('\n', ''))
+        # once the file has been read, need to put last elf's items into list
+        else:
+            elf_list.append([int(item) for item in buffer])
+    return elf_list
+
+def accumulate_elf_line(line, elf_total, elf_has_items):
+    '''Applies one line (str or bytes) to the elf being read.
+    Returns (finished elf's total or None, elf_total, elf_has_items) -- a blank line finishes the current elf.
+    '''
+    line = line.strip()
+    if not line:
+        return (elf_total if elf_has_items else None), 0, False
+    return None, elf_total + int(line), True
+
+def iterate_elf_totals(lines):
+    '''Generator -- yields one elf's total calories at a time from an iterable of lines (str or bytes).
+    Only the current elf's running total is held in memory.
+    '''
+    elf_total = 0
+    elf_has_items = False
+    for line in lines:
+        finished_elf_total, elf_total, elf_has_items = accumulate_elf_line(line, elf_total, elf_has_items)
+        if finished_elf_total is not None:
+            yield finished_elf_total
+    # last elf in the file might not be followed by a blank line
+    if elf_has_items:
+        yield elf_total
+
+def read_input_file_into_elf_totals(inputfile):
+    '''Streams the input file line-by-line, yielding each elf's total calories.'''
+    with open(inputfile, 'rb') as _inputfile:
+        yield from iterate_elf_totals(_inputfile)
+
+def top_k_elf_totals(elf_totals, k):
+    '''Keeps a min-heap of the k largest totals seen so far, so memory is O(k) regardless of number of elves.
+    Returns the top k totals, largest first.
+    '''
+    heap = []
+    for elf_total in elf_totals:
+        push_top_k(heap, elf_total, k)
+    return sorted(heap, reverse=True)
+
+def push_top_k(heap, elf_total, k):
+    if len(heap) < k:
+        heapq.heappush(heap, elf_total)
+    elif elf_total > heap[0]:
+        heapq.heapreplace(heap, elf_total)
+
+def find_next_elf_boundary(_inputfile, offset, blocksize=1 << 16):
+    '''Returns the first byte offset >= offset at which an elf starts (just after a blank line), or the end of file.
+    _inputfile must be opened in binary mode.
+    '''
+    if offset <= 0:
+        return 0
+    # the blank line's "\n\n" (or "\n\r\n") may begin up to three bytes before offset
+    pos = max(offset - 3, 0)
+    _inputfile.seek(pos)
+    carry = b''
+    while True:
+        block = _inputfile.read(blocksize)
+        if not block:
+            return pos + len(carry)
+        data = carry + block
+        # matches can overlap ("\n\n\n"), so step one byte past each match that ends before offset
+        match = BLANK_LINE.search(data)
+        while match is not None:
+            if pos + match.end() >= offset:
+                return pos + match.end()
+            match = BLANK_LINE.search(data, match.start() + 1)
+        # keep the last two bytes around in case "\n\r\n" straddles two blocks
+        carry = data[-2:]
+        pos += len(data) - len(carry)
+
+def iterate_lines_in_byte_range(_inputfile, start, end):
+    _inputfile.seek(start)
+    pos = start
+    while pos < end:
+        line = _inputfile.readline()
+        if not line:
+            return
+        pos += len(line)
+        yield line
+
+def top_k_elf_totals_in_byte_range(inputfile, start, end, k):
+    '''Worker -- top k elf totals of the elves in [start, end).  Both offsets must be elf boundaries.'''
+    with open(inputfile, 'rb') as _inputfile:
+        return top_k_elf_totals(iterate_elf_totals(iterate_lines_in_byte_range(_inputfile, start, end)), k)
+
+def parallel_top_k_elf_totals(inputfile, k, num_workers=None):
+    '''Splits the file into one byte range per worker process, with each range moved forward to the next
+    elf boundary so that no elf is split between workers.  Each worker computes a local top k,
+    and the partial results are merged into the overall top k (largest first).
+    '''
+    num_workers = num_workers or os.cpu_count()
+    file_size = os.path.getsize(inputfile)
+    with open(inputfile, 'rb') as _inputfile:
+        boundaries = {find_next_elf_boundary(_inputfile, file_size * i // num_workers) for i in range(num_workers)}
+    boundaries = sorted(boundaries | {file_size})
+    byte_ranges = [(inputfile, start, end, k) for start, end in zip(boundaries, boundaries[1:])]
+
+    with multiprocessing.Pool(num_workers) as pool:
+        partial_top_ks = pool.starmap(top_k_elf_totals_in_byte_range, byte_ranges)
+    return heapq.nlargest(k, itertools.chain.from_iterable(partial_top_ks))
+
+def load_checkpoint(checkpointfile, k):
+    '''Checkpoint = byte offset of the first unprocessed line, the partially-read elf and the top k heap,
+    plus the input file's path, inode and fingerprint (see fingerprint_input_file) at that offset.
+    '''
+    try:
+        with open(checkpointfile, 'r') as _checkpointfile:
+            checkpoint = json.load(_checkpointfile)
+        if checkpoint['k'] == k:
+            return checkpoint
+    except FileNotFoundError:
+        pass
+    return new_checkpoint(k)
+
+def new_checkpoint(k):
+    return {'k': k, 'offset': 0, 'elf_total': 0, 'elf_has_items': False, 'heap': [],
+            'inputfile': None, 'inode': None, 'fingerprint': None}
+
+def fingerprint_input_file(_inputfile, offset):
+    '''Hash of the (up to) FINGERPRINT_SIZE bytes just before offset.  _inputfile must be opened in binary mode.
+    Appending doesn't change it, but rewriting the already-processed data -- or truncating the file -- does.
+    '''
+    start = max(offset - FINGERPRINT_SIZE, 0)
+    _inputfile.seek(start)
+    return hashlib.sha256(_inputfile.read(offset - start)).hexdigest()
+
+def save_checkpoint(checkpointfile, checkpoint):
+    # write then rename, so an interrupted save never leaves a half-written checkpoint behind
+    with open(f'{checkpointfile}.tmp', 'w') as _checkpointfile:
+        json.dump(checkpoint, _checkpointfile)
+    os.replace(f'{checkpointfile}.tmp', checkpointfile)
+
+def update_top_k_from_checkpoint(inputfile, checkpointfile, k=3):
+    '''Processes only the bytes appended to inputfile since the last checkpoint, then saves a new checkpoint.
+    Returns the current top k totals (largest first), counting the partially-read last elf as it stands.
+
+    A trailing line without its newline might still be in the middle of being written,
+    so it is left for the next update.  If the checkpoint was made for a different file, or the bytes
+    before its offset changed (the file was replaced or rewritten), start over.
+    '''
+    checkpoint = load_checkpoint(checkpointfile, k)
+    inputpath = os.path.abspath(inputfile)
+
+    with open(inputfile, 'rb') as _inputfile:
+        inode = os.fstat(_inputfile.fileno()).st_ino
+        # .get() -- checkpoints saved before these fields existed don't match either
+        if (checkpoint.get('inputfile') != inputpath or checkpoint.get('inode') != inode
+                or checkpoint.get('fingerprint') != fingerprint_input_file(_inputfile, checkpoint['offset'])):
+            checkpoint = new_checkpoint(k)
+        heap = checkpoint['heap']
+        elf_total = checkpoint['elf_total']
+        elf_has_items = checkpoint['elf_has_items']
+        offset = checkpoint['offset']
+
+        _inputfile.seek(offset)
+        for line in _inputfile:
+            if not line.endswith(b'\n'):
+                break
+            offset += len(line)
+            finished_elf_total, elf_total, elf_has_items = accumulate_elf_line(line, elf_total, elf_has_items)
+            if finished_elf_total is not None:
+                push_top_k(heap, finished_elf_total, k)
+        fingerprint = fingerprint_input_file(_inputfile, offset)
+
+    save_checkpoint(checkpointfile, {'k': k, 'offset': offset, 'elf_total': elf_total, 'elf_has_items': elf_has_items, 'heap': heap,
+                                     'inputfile': inputpath, 'inode': inode, 'fingerprint': fingerprint})
+    return heapq.nlargest(k, heap + [elf_total] if elf_has_items else heap)
+
+def follow(inputfile, checkpointfile, k=3, poll_interval_s=1.0):
+    '''Polls the input file and prints updated answers whenever new data changes them (Ctrl+C to stop).'''
+    last_top_k = None
+    while True:
+        top_k = update_top_k_from_checkpoint(inputfile, checkpointfile, k)
+        if top_k != last_top_k and top_k:
+            print(f'Elf with most calories is carrying: {top_k[0]}  |  top {k} elves carrying: {sum(top_k)}')
+            last_top_k = top_k
+        time.sleep(poll_interval_s)
+
+def part_one_and_two(inputfile):
+    '''Both parts are answered from the same top-3 selection, made during a single pass over the file.'''
+    top_three = top_k_elf_totals(read_input_file_into_elf_totals(inputfile), k=3)
+    # no elves (empty or blank-only file) -> nothing carried
+    return (top_three[0] if top_three else 0), sum(top_three)
+
+if __name__ == '__main__':
+    if FOLLOW_MODE:
+        follow('input.txt', CHECKPOINT_FILE)
+    for inputfile in ['example.txt', 'input.txt']:
+        print(f'--- {inputfile}')
+        most_calories, top_three_calories = part_one_and_two(inputfile)
+        # PART ONE loop over elves and find max calories
+        print(f'Elf with most calories is carrying: {most_calories}')
+        # PART TWO find sum of top 3 elf calories
+        print(f'Total calories of top 3 elves carrying most calories: {top_three_calories}')
@@ -0,0 +1,172 @@
+# std library
+import os
+# third-party
+import numpy as np
+
+'''
+Vectorized engine for day 01 -- same parsing rules as solution.py, but instead of converting
+one line at a time with int(), the input file is memory-mapped and every numeric line is converted at once.
+
+    1. find the newlines -> line start/end index arrays
+    2. the digits are combined one column at a time across all lines (Horner's rule: value*10 + digit),
+       so the Python-level loop runs once per digit column instead of once per line
+    3. blank lines mark the elf boundaries -> another np.add.reduceat over the item calories gives every elf's total
+'''
+
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+ZERO    = ord('0')
+CHUNK_SIZE = 1 << 24  # bytes of the memory-mapped file converted per step, bounds the temporary arrays
+
+def parse_chunk_into_item_calories(chunk, prev_line_blank):
+    '''Converts a newline-terminated chunk of the file into its item calories.
+
+    Returns
+        item_calories    -- one entry per non-blank line
+        elf_start_flags  -- True where the item is the first one of an elf (the line before it was blank)
+        last_line_blank  -- carried over into the next chunk
+    '''
+    newlines    = np.flatnonzero(chunk == NEWLINE)
+    line_starts = np.empty_like(newlines)
+    line_starts[0]  = 0
+    line_starts[1:] = newlines[:-1] + 1
+    # line ends exclude the '\n' or '\r\n', so a CRLF blank line is still blank
+    line_ends = newlines - (chunk[np.maximum(newlines - 1, 0)] == CARRIAGE_RETURN)
+
+    is_item_line = line_ends > line_starts
+    item_starts  = line_starts[is_item_line]
+    item_lengths = (line_ends - line_starts)[is_item_line]
+
+    # Horner's rule, one digit column at a time: value = value*10 + next digit (for lines that still have digits left)
+    item_calories = np.zeros(len(item_starts), dtype=np.int64)
+    for column in range(item_lengths.max(initial=0)):
+        has_digit = item_lengths > column
+        digits = chunk[np.minimum(item_starts + column, len(chunk) - 1)].astype(np.int64) - ZERO
+        item_calories = np.where(has_digit, item_calories * 10 + digits, item_calories)
+
+    is_prev_line_blank = np.empty_like(is_item_line)
+    is_prev_line_blank[0]  = prev_line_blank
+    is_prev_line_blank[1:] = ~is_item_line[:-1]
+    elf_start_flags = is_prev_line_blank[is_item_line]
+
+    return item_calories, elf_start_flags, not is_item_line[-1]
+
+def parse_input_file_into_item_calories_and_elf_starts(inputfile, chunk_size=CHUNK_SIZE):
+    '''Memory-maps the input file and converts it, chunk by chunk, into
+        item_calories -- flat array of every item's calories, in file order
+        elf_starts    -- index into item_calories of each elf's first item
+    '''
+    if os.path.getsize(inputfile) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    buf = np.memmap(inputfile, dtype=np.uint8, mode='r')
+
+    calorie_chunks = []
+    elf_start_chunks = []
+    prev_line_blank = True  # first line of the file starts an elf
+    chunk_start = 0
+    while chunk_start < len(buf):
+        chunk_end = min(chunk_start + chunk_size, len(buf))
+        # only hand complete lines to the parser -- move the end back to just after the last newline
+        if chunk_end < len(buf):
+            newlines = np.flatnonzero(buf[chunk_start:chunk_end] == NEWLINE)
+            if len(newlines):
+                chunk_end = chunk_start + newlines[-1] + 1
+            else:  # single line longer than the chunk
+                newlines = np.flatnonzero(buf[chunk_end:] == NEWLINE)
+                chunk_end = chunk_end + newlines[0] + 1 if len(newlines) else len(buf)
+        chunk = np.asarray(buf[chunk_start:chunk_end])
+        # the last line of the file might not have a trailing newline
+        if chunk[-1] != NEWLINE:
+            chunk = np.append(chunk, np.uint8(NEWLINE))
+
+        item_calories, elf_start_flags, prev_line_blank = parse_chunk_into_item_calories(chunk, prev_line_blank)
+        calorie_chunks.append(item_calories)
+        elf_start_chunks.append(elf_start_flags)
+        chunk_start = chunk_end
+
+    item_calories = np.concatenate(calorie_chunks)
+    elf_starts = np.flatnonzero(np.concatenate(elf_start_chunks))
+    return item_calories, elf_starts
+
+def elf_totals_from_item_calories(item_calories, elf_starts):
+    '''One segmented reduction gives every elf's total calories.'''
+    if len(elf_starts) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.add.reduceat(item_calories, elf_starts)
+
+def top_k_elf_totals(elf_totals, k):
+    '''Partial selection of the k largest totals (no full sort), returned largest first.'''
+    k = min(k, len(elf_totals))
+    if k == 0:
+        return []
+    top_k = np.partition(elf_totals, len(elf_totals) - k)[-k:]
+    return sorted(top_k.tolist(), reverse=True)
+
+class ElfInventory:
+    '''Item-level data for every elf, in CSR (compressed sparse row) layout instead of a list of lists:
+        item_calories -- one flat array of every item's calories, in file order
+        offsets       -- elf i's items are item_calories[offsets[i]:offsets[i+1]]  (len = number of elves + 1)
+    '''
+    def __init__(self, item_calories, offsets):
+        # items only need 4 bytes each unless some item doesn't fit.  totals are always summed as int64.
+        if len(item_calories) and item_calories.max() <= np.iinfo(np.int32).max:
+            item_calories = item_calories.astype(np.int32)
+        self.item_calories = item_calories
+        self.offsets = offsets
+        self._totals = None
+
+    @classmethod
+    def from_input_file(cls, inputfile):
+        item_calories, elf_starts = parse_input_file_into_item_calories_and_elf_starts(inputfile)
+        return cls(item_calories, np.append(elf_starts, len(item_calories)))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __repr__(self):
+        return f'ElfInventory(num_elves={len(self)}, num_items={len(self.item_calories)})'
+
+    def items_for_elf(self, elf_idx):
+        '''View (no copy) of the elf's item calories.'''
+        return self.item_calories[self.offsets[elf_idx]:self.offsets[elf_idx+1]]
+
+    def total_for_elf(self, elf_idx):
+        return int(self.totals[elf_idx])
+
+    @property
+    def totals(self):
+        if self._totals is None:
+            self._totals = elf_totals_from_item_calories(self.item_calories.astype(np.int64), self.offsets[:-1])
+        return self._totals
+
+    def nth_heaviest_elf(self, n):
+        '''Index of the elf carrying the n-th most calories (n=1 is the heaviest).
+        Partial selection -- only puts the n-th element in its sorted place, O(num elves).
+        '''
+        if not 1 <= n <= len(self):
+            raise IndexError(f'n must be between 1 and the number of elves ({len(self)}), got {n}')
+        kth = len(self) - n
+        return int(np.argpartition(self.totals, kth)[kth])
+
+    def top_k_elves(self, k):
+        '''Indices of the k heaviest elves, heaviest first.  Only the selected k get sorted.'''
+        if k < 0:
+            raise ValueError(f'k must not be negative, got {k}')
+        k = min(k, len(self))
+        if k == 0:
+            return []
+        top_k = np.argpartition(self.totals, len(self) - k)[-k:]
+        return top_k[np.argsort(self.totals[top_k])[::-1]].tolist()
+
+def part_one_and_two(inputfile):
+    inventory = ElfInventory.from_input_file(inputfile)
+    top_three = top_k_elf_totals(inventory.totals, k=3)
+    # no elves (empty or blank-only file) -> nothing carried
+    return (top_three[0] if top_three else 0), sum(top_three)
+
+if __name__ == '__main__':
+    for inputfile in ['example.txt', 'input.txt']:
+        print(f'--- {inputfile}')
+        most_calories, top_three_calories = part_one_and_two(inputfile)
+        print(f'Elf with most calories is carrying: {most_calories}')
+        print(f'Total calories of top 3 elves carrying most calories: {top_three_calories}')
@@ -0,0 +1,116 @@
+# std library
+import os
+import re
+import tempfile
+import unittest
+# local
+import solution
+
+class TestDay01(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_streaming_elf_totals_match_elf_list(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            with self.subTest(i=textfile):
+                elf_list = solution.read_input_file_into_elf_list(textfile)
+                self.assertEqual(
+                    list(solution.read_input_file_into_elf_totals(textfile)),
+                    [sum(food_list) for food_list in elf_list]
+                )
+
+    def test_top_k_elf_totals(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            elf_total_calorie_list = [sum(food_list) for food_list in solution.read_input_file_into_elf_list(textfile)]
+            elf_total_calorie_list.sort(reverse=True)
+            for k in (1, 3, 5):
+                with self.subTest(i=f'{textfile} k={k}'):
+                    top_k = solution.top_k_elf_totals(solution.read_input_file_into_elf_totals(textfile), k)
+                    self.assertEqual(top_k, elf_total_calorie_list[:k])
+
+    def verify_elf_boundaries(self, textfile):
+        with open(textfile, 'rb') as exfile:
+            contents = exfile.read()
+            # every (possibly overlapping) "\n\n" or "\n\r\n" -- an elf starts right after it
+            elf_starts = [0] + [match.start() + len(match.group(1)) for match in re.finditer(rb'(?=(\n\r?\n))', contents)]
+            for blocksize in (1, 2, 3, 1 << 16):
+                for offset in range(len(contents) + 1):
+                    with self.subTest(i=f'{textfile} blocksize={blocksize} offset={offset}'):
+                        expected = min([start for start in elf_starts if start >= offset], default=len(contents))
+                        self.assertEqual(solution.find_next_elf_boundary(exfile, offset, blocksize=blocksize), expected)
+
+    def test_elf_boundaries(self):
+        self.verify_elf_boundaries(self.EXAMPLE)
+
+    def test_elf_boundaries_crlf(self):
+        with open(self.EXAMPLE, 'rb') as exfile:
+            contents = exfile.read().replace(b'\n', b'\r\n')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            crlffile = os.path.join(tmpdir, 'crlf.txt')
+            with open(crlffile, 'wb') as f:
+                f.write(contents)
+            self.verify_elf_boundaries(crlffile)
+            # offsets past the start resolve to the next elf, not the end of the file
+            with open(crlffile, 'rb') as f:
+                self.assertEqual(solution.find_next_elf_boundary(f, 1), contents.index(b'\n\r\n') + 3)
+            self.assertEqual(solution.parallel_top_k_elf_totals(crlffile, k=3, num_workers=3), [24000, 11000, 10000])
+
+    def test_parallel_top_k_matches_sorted_totals(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            elf_total_calorie_list = [sum(food_list) for food_list in solution.read_input_file_into_elf_list(textfile)]
+            elf_total_calorie_list.sort(reverse=True)
+            for num_workers in (1, 3, 8):
+                with self.subTest(i=f'{textfile} num_workers={num_workers}'):
+                    top_three = solution.parallel_top_k_elf_totals(textfile, k=3, num_workers=num_workers)
+                    self.assertEqual(top_three, elf_total_calorie_list[:3])
+
+    def test_checkpointed_updates_match_full_pass(self):
+        with open(self.INPUT, 'rb') as inputfile:
+            contents = inputfile.read()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            growingfile = os.path.join(tmpdir, 'growing.txt')
+            checkpointfile = os.path.join(tmpdir, 'checkpoint.json')
+            # append the input in uneven pieces -- splits land mid-line and mid-elf
+            with open(growingfile, 'wb') as f:
+                for start in range(0, len(contents), 997):
+                    f.write(contents[start:start+997])
+                    f.flush()
+                    top_three = solution.update_top_k_from_checkpoint(growingfile, checkpointfile, k=3)
+                    # only complete lines are counted
+                    complete = contents[:start+997]
+                    complete = complete[:complete.rfind(b'\n') + 1]
+                    with self.subTest(i=start):
+                        self.assertEqual(top_three, solution.top_k_elf_totals(solution.iterate_elf_totals(complete.splitlines()), k=3))
+            # replacing the file with a shorter one starts over
+            with open(growingfile, 'wb') as f:
+                f.write(b'5\n\n6\n')
+            self.assertEqual(solution.update_top_k_from_checkpoint(growingfile, checkpointfile, k=3), [6, 5])
+            # ... and so does rewriting it with the same size, or a larger one, in place
+            with open(growingfile, 'wb') as f:
+                f.write(b'7\n\n8\n')
+            self.assertEqual(solution.update_top_k_from_checkpoint(growingfile, checkpointfile, k=3), [8, 7])
+            with open(growingfile, 'wb') as f:
+                f.write(b'1\n\n2\n\n3\n')
+            self.assertEqual(solution.update_top_k_from_checkpoint(growingfile, checkpointfile, k=3), [3, 2, 1])
+            # the checkpoint belongs to growing.txt -- a different file starts over too
+            otherfile = os.path.join(tmpdir, 'other.txt')
+            with open(otherfile, 'wb') as f:
+                f.write(b'1\n\n2\n\n3\n\n4\n')
+            self.assertEqual(solution.update_top_k_from_checkpoint(otherfile, checkpointfile, k=3), [4, 3, 2])
+
+    def test_no_elves(self):
+        for contents in ['', '\n\n\n']:
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+                f.write(contents)
+            try:
+                with self.subTest(i=repr(contents)):
+                    self.assertEqual(solution.part_one_and_two(f.name), (0, 0))
+            finally:
+                os.remove(f.name)
+
+    def test_example_answers(self):
+        self.assertEqual(solution.part_one_and_two(self.EXAMPLE), (24000, 45000))
+
+if __name__ == '__main__':
+    unittest.main()
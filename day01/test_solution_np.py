@@ -0,0 +1,95 @@
+# std library
+import os
+import tempfile
+import unittest
+# local
+import solution
+import solution_np
+
+class TestDay01Numpy(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def verify_elf_totals(self, textfile, chunk_size=solution_np.CHUNK_SIZE):
+        item_calories, elf_starts = solution_np.parse_input_file_into_item_calories_and_elf_starts(textfile, chunk_size)
+        self.assertEqual(
+            solution_np.elf_totals_from_item_calories(item_calories, elf_starts).tolist(),
+            [sum(food_list) for food_list in solution.read_input_file_into_elf_list(textfile)]
+        )
+
+    def test_elf_totals_match_readlines_parser(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            # small chunk sizes force elves (and lines) to straddle chunk boundaries
+            for chunk_size in (7, 64, 1000, solution_np.CHUNK_SIZE):
+                with self.subTest(i=f'{textfile} chunk_size={chunk_size}'):
+                    self.verify_elf_totals(textfile, chunk_size)
+
+    def test_no_trailing_newline(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('1\n2\n\n30\n\n400\n5')
+        try:
+            self.verify_elf_totals(f.name, chunk_size=4)
+        finally:
+            os.remove(f.name)
+
+    def test_crlf_line_endings(self):
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+            f.write(b'1000\r\n2000\r\n\r\n4000\r\n\r\n5\r\n6')
+        try:
+            # chunk sizes that split a '\r\n' between chunks
+            for chunk_size in (3, 5, 6, solution_np.CHUNK_SIZE):
+                with self.subTest(i=f'chunk_size={chunk_size}'):
+                    self.verify_elf_totals(f.name, chunk_size)
+            self.assertEqual(solution_np.part_one_and_two(f.name), (4000, 7011))
+        finally:
+            os.remove(f.name)
+
+    def test_elf_inventory(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            elf_list = solution.read_input_file_into_elf_list(textfile)
+            inventory = solution_np.ElfInventory.from_input_file(textfile)
+            self.assertEqual(len(inventory), len(elf_list))
+            for i, food_list in enumerate(elf_list):
+                with self.subTest(i=f'{textfile} elf {i}'):
+                    self.assertEqual(inventory.items_for_elf(i).tolist(), food_list)
+                    self.assertEqual(inventory.total_for_elf(i), sum(food_list))
+            # rank queries vs. a full sort
+            ranked = sorted(range(len(elf_list)), key=lambda i: sum(elf_list[i]), reverse=True)
+            for n in (1, 2, 3, len(elf_list)):
+                with self.subTest(i=f'{textfile} rank {n}'):
+                    self.assertEqual(inventory.total_for_elf(inventory.nth_heaviest_elf(n)), sum(elf_list[ranked[n-1]]))
+            self.assertEqual(
+                [inventory.total_for_elf(i) for i in inventory.top_k_elves(3)],
+                [sum(elf_list[i]) for i in ranked[:3]]
+            )
+
+    def test_elf_inventory_rank_out_of_range(self):
+        inventory = solution_np.ElfInventory.from_input_file(self.EXAMPLE)
+        for n in (0, -1, len(inventory) + 1):
+            with self.subTest(i=f'rank {n}'):
+                with self.assertRaises(IndexError):
+                    inventory.nth_heaviest_elf(n)
+        with self.assertRaises(ValueError):
+            inventory.top_k_elves(-1)
+        self.assertEqual(inventory.top_k_elves(0), [])
+        self.assertEqual(len(inventory.top_k_elves(len(inventory) + 1)), len(inventory))
+
+    def test_no_elves(self):
+        for contents in ['', '\n\n\n']:
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+                f.write(contents)
+            try:
+                with self.subTest(i=repr(contents)):
+                    self.assertEqual(solution_np.part_one_and_two(f.name), (0, 0))
+            finally:
+                os.remove(f.name)
+
+    def test_example_answers(self):
+        self.assertEqual(solution_np.part_one_and_two(self.EXAMPLE), (24000, 45000))
+
+    def test_input_answers_match_streaming_engine(self):
+        self.assertEqual(solution_np.part_one_and_two(self.INPUT), solution.part_one_and_two(self.INPUT))
+
+if __name__ == '__main__':
+    unittest.main()
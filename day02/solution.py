@@ -0,0 +1,114 @@
+from collections import Counter
+
+'''
+shape points
+    1   rock     = A = X
+    2   paper    = B = Y
+    3   scissors = C = Z
+
+outcome points
+    0   loss
+    3   tie
+    6   win
+
+Count-then-score engine for both parts.
+There are only 9 distinct kinds of line in a strategy guide ('A X', 'A Y', ... 'C Z'), so instead of decoding
+every line, the file is read once and the occurrences of each kind are counted.  Each part's total is then
+the sum of (count * score) over a precomputed 9-entry score table -- O(9) work once counting is done.
+'''
+# encoding knowledge into constants / dicts
+
+ROCK = 'rock'
+PAPER = 'paper'
+SCISSORS = 'scissors'
+WIN = 'win'
+TIE = 'tie'
+LOSS = 'loss'
+opponent_decoder = {
+    'A' : ROCK,
+    'B' : PAPER,
+    'C' : SCISSORS,
+}
+# part one -- X, Y, Z are the shape we should play
+part_one_decoder = {
+    'X' : ROCK,
+    'Y' : PAPER,
+    'Z' : SCISSORS,
+}
+# part two -- X, Y, Z are the outcome we need
+part_two_decoder = {
+    'X' : LOSS,
+    'Y' : TIE,
+    'Z' : WIN,
+}
+shape_points = {
+    ROCK : 1,
+    PAPER : 2,
+    SCISSORS : 3,
+}
+outcome_points = {
+    WIN : 6,
+    TIE : 3,
+    LOSS : 0
+}
+outcomes = {
+    # (opp_shape, our_shape) : outcome
+
+    (ROCK, PAPER) : WIN,
+    (ROCK, ROCK) : TIE,
+    (ROCK, SCISSORS) : LOSS,
+
+    (PAPER, PAPER) : TIE,
+    (PAPER, ROCK) : LOSS,
+    (PAPER, SCISSORS) : WIN,
+
+    (SCISSORS, PAPER) : LOSS,
+    (SCISSORS, ROCK) : WIN,
+    (SCISSORS, SCISSORS) : TIE,
+}
+# part two -- which shape do we need to play for the desired outcome?
+shape_for_outcome = {(opp_shape, outcome) : our_shape for (opp_shape, our_shape), outcome in outcomes.items()}
+
+def score_round_part_one(opponent_symbol, our_symbol):
+    opponent_shape = opponent_decoder[opponent_symbol]
+    our_shape = part_one_decoder[our_symbol]
+    return outcome_points[outcomes[(opponent_shape, our_shape)]] + shape_points[our_shape]
+
+def score_round_part_two(opponent_symbol, our_symbol):
+    opponent_shape = opponent_decoder[opponent_symbol]
+    desired_outcome = part_two_decoder[our_symbol]
+    return outcome_points[desired_outcome] + shape_points[shape_for_outcome[(opponent_shape, desired_outcome)]]
+
+def build_score_table(score_round_fn):
+    '''Maps each of the 9 line kinds (as raw bytes, ex: b'A X') to its score.'''
+    return {
+        f'{opponent_symbol} {our_symbol}'.encode() : score_round_fn(opponent_symbol, our_symbol)
+        for opponent_symbol in opponent_decoder for our_symbol in part_one_decoder
+    }
+
+PART_ONE_SCORES = build_score_table(score_round_part_one)
+PART_TWO_SCORES = build_score_table(score_round_part_two)
+
+def count_line_kinds(inputfile):
+    '''Single pass over the raw bytes of the file, counting occurrences of each line kind.'''
+    with open(inputfile, 'rb') as strategyguide:
+        raw_counts = Counter(strategyguide)
+    # the last line might be missing its newline -- fold it in with the others
+    line_kinds = Counter()
+    for line, count in raw_counts.items():
+        line = line.strip()
+        if line:
+            line_kinds[line] += count
+    return line_kinds
+
+def score_line_kinds(line_kinds, score_table):
+    return sum(score_table[line_kind] * count for line_kind, count in line_kinds.items())
+
+def part_one_and_two(inputfile):
+    line_kinds = count_line_kinds(inputfile)
+    return score_line_kinds(line_kinds, PART_ONE_SCORES), score_line_kinds(line_kinds, PART_TWO_SCORES)
+
+if __name__ == '__main__':
+    for strategy_guide in ['example.txt', 'input.txt']:
+        part_one_score, part_two_score = part_one_and_two(strategy_guide)
+        print(f'Total score using {strategy_guide}: {part_one_score} (part one), {part_two_score} (part two)')
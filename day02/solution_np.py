@@ -0,0 +1,196 @@
+# std library
+import itertools
+from collections import namedtuple
+# third-party
+import numpy as np
+
+'''
+Generalized cyclic game engine -- rock/paper/scissors, rock/paper/scissors/lizard/spock, or any odd-N variant.
+
+Shapes are listed in "cyclic order": every shape beats the (N-1)/2 shapes listed before it (wrapping around).
+That way the outcome of a round is decided with modular arithmetic instead of a dict of (opp, our) pairs:
+
+    d = (our_shape - opp_shape) % N
+        d == 0              tie
+        1 <= d <= (N-1)/2   win
+        otherwise           loss
+
+All N*N outcomes / scores are precomputed into dense matrices indexed by [opponent shape, our shape],
+so scoring a strategy guide is a single fancy-index lookup + sum over the whole guide.
+'''
+
+LOSS_IDX = 0
+TIE_IDX  = 1
+WIN_IDX  = 2
+OUTCOME_NAMES  = ('loss', 'tie', 'win')
+OUTCOME_POINTS = (0, 3, 6)  # loss, tie, win
+
+# summary of a simulated tournament -- per-round score statistics
+TournamentResult = namedtuple('TournamentResult', ['num_rounds', 'total_score', 'mean', 'variance'])
+SIMULATION_BATCH_SIZE = 1_000_000
+
+# score of a strategy guide when our symbols are read as shapes (part one) or as outcomes (part two)
+SymbolMapping = namedtuple('SymbolMapping', ['interpretation', 'mapping', 'score'])
+
+class CyclicGame:
+    def __init__(self, shape_names, opponent_symbols, our_symbols, shape_points=None, outcome_points=OUTCOME_POINTS):
+        num_shapes = len(shape_names)
+        if num_shapes % 2 == 0:
+            raise ValueError(f'Cyclic games need an odd number of shapes, got {num_shapes}')
+        if not len(opponent_symbols) == len(our_symbols) == num_shapes:
+            raise ValueError('Need one opponent symbol and one of our symbols per shape')
+        self.shape_names = tuple(shape_names)
+        self.opponent_symbols = opponent_symbols
+        self.our_symbols = our_symbols
+        # by default, shapes are worth 1, 2, ... N points in listed order (matches rock, paper, scissors = 1, 2, 3)
+        self.shape_points = np.arange(1, num_shapes + 1) if shape_points is None else np.asarray(shape_points)
+        self.outcome_points = np.asarray(outcome_points)
+
+        # outcome_matrix[opp_shape, our_shape] = LOSS_IDX / TIE_IDX / WIN_IDX
+        shape_idx = np.arange(num_shapes)
+        d = (shape_idx[np.newaxis, :] - shape_idx[:, np.newaxis]) % num_shapes
+        self.outcome_matrix = np.where(d == 0, TIE_IDX, np.where(d <= num_shapes // 2, WIN_IDX, LOSS_IDX))
+        self.score_matrix = self.outcome_points[self.outcome_matrix] + self.shape_points[np.newaxis, :]
+
+        # byte -> shape index lookup tables (-1 = not a symbol of this game)
+        self.opponent_lut = np.full(256, -1, dtype=np.int64)
+        self.our_lut = np.full(256, -1, dtype=np.int64)
+        for i, (opponent_symbol, our_symbol) in enumerate(zip(opponent_symbols, our_symbols)):
+            self.opponent_lut[ord(opponent_symbol)] = i
+            self.our_lut[ord(our_symbol)] = i
+
+    def __len__(self):
+        return len(self.shape_names)
+
+    def __repr__(self):
+        return f'CyclicGame(shape_names={self.shape_names}, opponent_symbols={self.opponent_symbols!r}, our_symbols={self.our_symbols!r})'
+
+    def outcome(self, opponent_shape, our_shape):
+        '''Scalar lookup by shape name -> 'loss' / 'tie' / 'win'.'''
+        outcome_idx = self.outcome_matrix[self.shape_names.index(opponent_shape), self.shape_names.index(our_shape)]
+        return OUTCOME_NAMES[outcome_idx]
+
+    def parse_strategy_guide(self, inputfile):
+        '''Reads the whole guide as one byte buffer -> (opponent shape index array, our shape index array).
+        Every line is "<opponent symbol> <our symbol>", so dropping the whitespace bytes leaves the symbols in pairs.
+        '''
+        buf = np.fromfile(inputfile, dtype=np.uint8)
+        symbols = buf[(buf != ord(' ')) & (buf != ord('\n')) & (buf != ord('\r'))]
+        if len(symbols) % 2:
+            raise ValueError(f'{inputfile}: every round needs two symbols')
+        symbols = symbols.reshape(-1, 2)
+        opponent_shapes = self.opponent_lut[symbols[:, 0]]
+        our_shapes = self.our_lut[symbols[:, 1]]
+        if (opponent_shapes < 0).any() or (our_shapes < 0).any():
+            raise ValueError(f'{inputfile}: contains symbols that are not part of {self}')
+        return opponent_shapes, our_shapes
+
+    def score_rounds(self, opponent_shapes, our_shapes):
+        '''Per-round scores for arrays of shape indices.'''
+        return self.score_matrix[opponent_shapes, our_shapes]
+
+    def score_strategy_guide(self, inputfile):
+        opponent_shapes, our_shapes = self.parse_strategy_guide(inputfile)
+        return int(self.score_rounds(opponent_shapes, our_shapes).sum())
+
+    def count_rounds(self, inputfile):
+        '''counts[opponent shape, our symbol] = number of rounds in the guide -- the only thing any mapping needs.'''
+        opponent_shapes, our_symbols = self.parse_strategy_guide(inputfile)
+        num_shapes = len(self)
+        return np.bincount(opponent_shapes * num_shapes + our_symbols, minlength=num_shapes**2).reshape(num_shapes, num_shapes)
+
+    def outcome_score_matrix(self):
+        '''[opponent shape, outcome] -> score when we play for that outcome.
+        With more than 3 shapes several shapes give the same outcome -- we'd pick the one worth the most points.
+        '''
+        outcome_scores = np.zeros((len(self), len(OUTCOME_NAMES)), dtype=np.int64)
+        for outcome_idx in range(len(OUTCOME_NAMES)):
+            shape_points_for_outcome = np.where(self.outcome_matrix == outcome_idx, self.shape_points[np.newaxis, :], 0)
+            outcome_scores[:, outcome_idx] = self.outcome_points[outcome_idx] + shape_points_for_outcome.max(axis=1)
+        return outcome_scores
+
+    def score_all_symbol_mappings(self, counts):
+        '''Scores the guide under every mapping of our symbols to shapes, and (3-shape games only) to outcomes.
+        Each mapping is a permutation matrix P[symbol, target], so the counts per [opponent, target] are counts @ P,
+        and the score is that weighted by the score matrix -- no re-parsing per mapping.
+        '''
+        interpretations = [('shape', self.shape_names, self.score_matrix)]
+        if len(self) == len(OUTCOME_NAMES):
+            interpretations.append(('outcome', OUTCOME_NAMES, self.outcome_score_matrix()))
+
+        symbol_mappings = []
+        for interpretation, target_names, score_matrix in interpretations:
+            for permutation in itertools.permutations(range(len(target_names))):
+                permutation_matrix = np.eye(len(target_names), dtype=np.int64)[list(permutation)]
+                score = int(((counts @ permutation_matrix) * score_matrix).sum())
+                mapping = {symbol : target_names[target] for symbol, target in zip(self.our_symbols, permutation)}
+                symbol_mappings.append(SymbolMapping(interpretation, mapping, score))
+        return symbol_mappings
+
+    def best_and_worst_symbol_mappings(self, inputfile):
+        symbol_mappings = self.score_all_symbol_mappings(self.count_rounds(inputfile))
+        return max(symbol_mappings, key=lambda m: m.score), min(symbol_mappings, key=lambda m: m.score)
+
+def normalize_strategy(game, strategy):
+    '''strategy -> N x N matrix of probabilities [opponent shape, our shape].
+    None = play uniformly at random, 1-D = same weights whatever the opponent plays, 2-D = one row of weights per opponent shape.
+    '''
+    num_shapes = len(game)
+    if strategy is None:
+        strategy = np.ones(num_shapes)
+    strategy = np.broadcast_to(np.asarray(strategy, dtype=np.float64), (num_shapes, num_shapes))
+    return strategy / strategy.sum(axis=1, keepdims=True)
+
+def expected_score_per_round(game, opponent_weights=None, strategy=None):
+    '''Exact expected value, for comparison against the simulation.'''
+    opponent_weights = normalize_strategy(game, opponent_weights)[0]
+    strategy = normalize_strategy(game, strategy)
+    return float(opponent_weights @ (strategy * game.score_matrix).sum(axis=1))
+
+def simulate_tournament(game, num_rounds, opponent_weights=None, strategy=None, seed=None, batch_size=SIMULATION_BATCH_SIZE):
+    '''Plays num_rounds random rounds and returns the per-round score statistics.
+        opponent_weights -- how often the opponent plays each shape (default: uniform)
+        strategy         -- how we respond, see normalize_strategy() (default: uniform)
+    Rounds are generated and scored in array batches of batch_size, so memory doesn't grow with num_rounds.
+    '''
+    if num_rounds <= 0:
+        raise ValueError(f'num_rounds must be positive, got {num_rounds}')
+    rng = np.random.default_rng(seed)
+    num_shapes = len(game)
+    opponent_weights = normalize_strategy(game, opponent_weights)[0]
+    strategy_cdf = np.cumsum(normalize_strategy(game, strategy), axis=1)
+
+    total_score = 0
+    total_score_squared = 0
+    for batch_start in range(0, num_rounds, batch_size):
+        batch_rounds = min(batch_size, num_rounds - batch_start)
+        opponent_shapes = rng.choice(num_shapes, size=batch_rounds, p=opponent_weights)
+        # inverse-CDF sampling of our response, using the CDF row for each round's opponent shape
+        u = rng.random(batch_rounds)
+        our_shapes = (u[:, np.newaxis] >= strategy_cdf[opponent_shapes]).sum(axis=1)
+        np.minimum(our_shapes, num_shapes - 1, out=our_shapes)  # guard against float round-off in the last CDF entry
+
+        scores = game.score_rounds(opponent_shapes, our_shapes)
+        total_score += int(scores.sum())
+        total_score_squared += int((scores * scores).sum())
+
+    mean = total_score / num_rounds
+    variance = total_score_squared / num_rounds - mean**2
+    return TournamentResult(num_rounds, total_score, mean, variance)
+
+ROCK_PAPER_SCISSORS = CyclicGame(('rock', 'paper', 'scissors'), opponent_symbols='ABC', our_symbols='XYZ')
+# cyclic order: each beats the two before it -- spock vaporizes rock, paper disproves spock, lizard eats paper, ...
+ROCK_PAPER_SCISSORS_LIZARD_SPOCK = CyclicGame(('rock', 'spock', 'paper', 'lizard', 'scissors'), opponent_symbols='ABCDE', our_symbols='VWXYZ')
+
+if __name__ == '__main__':
+    for strategy_guide in ['example.txt', 'input.txt']:
+        print(f'Total score using {strategy_guide}: {ROCK_PAPER_SCISSORS.score_strategy_guide(strategy_guide)}')
+        best, worst = ROCK_PAPER_SCISSORS.best_and_worst_symbol_mappings(strategy_guide)
+        print(f'    best mapping:  {best.score:>6}  ({best.interpretation}s) {best.mapping}')
+        print(f'    worst mapping: {worst.score:>6}  ({worst.interpretation}s) {worst.mapping}')
+
+    # simulate -- random play vs. answering with the winning shape 80% of the time
+    mostly_win = np.where(ROCK_PAPER_SCISSORS.outcome_matrix == WIN_IDX, 0.8, 0.1)
+    for name, strategy in [('random', None), ('80% win', mostly_win)]:
+        result = simulate_tournament(ROCK_PAPER_SCISSORS, num_rounds=10_000_000, strategy=strategy, seed=2022)
+        print(f'Simulated {result.num_rounds} rounds ({name}): mean score {result.mean:.4f}, variance {result.variance:.4f}')
@@ -0,0 +1,35 @@
+# std library
+import contextlib
+import io
+import runpy
+import unittest
+# local
+import solution
+
+class TestDay02(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_example_answers(self):
+        self.assertEqual(solution.part_one_and_two(self.EXAMPLE), (15, 12))
+
+    def test_input_answers_match_original_scripts(self):
+        # the original scripts score input.txt line-by-line when run
+        with contextlib.redirect_stdout(io.StringIO()):
+            part_one_score = runpy.run_path('solution_partone.py')['total_score']
+            part_two_score = runpy.run_path('solution_parttwo.py')['total_score']
+        self.assertEqual(solution.part_one_and_two(self.INPUT), (part_one_score, part_two_score))
+
+    def test_score_tables(self):
+        self.assertEqual(len(solution.PART_ONE_SCORES), 9)
+        self.assertEqual(len(solution.PART_TWO_SCORES), 9)
+        for line_kind, score in [(b'A Y', 8), (b'B X', 1), (b'C Z', 6)]:
+            with self.subTest(i=line_kind):
+                self.assertEqual(solution.PART_ONE_SCORES[line_kind], score)
+        for line_kind, score in [(b'A Y', 4), (b'B X', 1), (b'C Z', 7)]:
+            with self.subTest(i=line_kind):
+                self.assertEqual(solution.PART_TWO_SCORES[line_kind], score)
+
+if __name__ == '__main__':
+    unittest.main()
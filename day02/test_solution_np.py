@@ -0,0 +1,110 @@
+# std library
+import math
+import os
+import tempfile
+import unittest
+# local
+import solution
+import solution_np
+from solution_np import CyclicGame, ROCK_PAPER_SCISSORS, ROCK_PAPER_SCISSORS_LIZARD_SPOCK
+
+class TestDay02Numpy(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_rock_paper_scissors_matches_outcomes_dict(self):
+        for (opp_shape, our_shape), outcome in solution.outcomes.items():
+            with self.subTest(i=f'{opp_shape} vs {our_shape}'):
+                self.assertEqual(ROCK_PAPER_SCISSORS.outcome(opp_shape, our_shape), outcome)
+
+    def test_score_matrix_matches_part_one_table(self):
+        for line_kind, score in solution.PART_ONE_SCORES.items():
+            opp_symbol, our_symbol = line_kind.decode().split(' ')
+            with self.subTest(i=line_kind):
+                self.assertEqual(
+                    ROCK_PAPER_SCISSORS.score_matrix[ROCK_PAPER_SCISSORS.opponent_symbols.index(opp_symbol),
+                                                     ROCK_PAPER_SCISSORS.our_symbols.index(our_symbol)],
+                    score
+                )
+
+    def test_strategy_guide_scores(self):
+        self.assertEqual(ROCK_PAPER_SCISSORS.score_strategy_guide(self.EXAMPLE), 15)
+        self.assertEqual(ROCK_PAPER_SCISSORS.score_strategy_guide(self.INPUT), solution.part_one_and_two(self.INPUT)[0])
+
+    def test_rock_paper_scissors_lizard_spock(self):
+        game = ROCK_PAPER_SCISSORS_LIZARD_SPOCK
+        for winner, loser in [('scissors', 'paper'), ('paper', 'rock'), ('rock', 'lizard'), ('lizard', 'spock'),
+                              ('spock', 'scissors'), ('scissors', 'lizard'), ('lizard', 'paper'), ('paper', 'spock'),
+                              ('spock', 'rock'), ('rock', 'scissors')]:
+            with self.subTest(i=f'{winner} beats {loser}'):
+                self.assertEqual(game.outcome(loser, winner), 'win')
+                self.assertEqual(game.outcome(winner, loser), 'loss')
+        # every shape ties itself, and beats exactly half of the others
+        self.assertTrue((game.outcome_matrix.diagonal() == solution_np.TIE_IDX).all())
+        self.assertTrue(((game.outcome_matrix == solution_np.WIN_IDX).sum(axis=1) == 2).all())
+
+    def test_rock_paper_scissors_lizard_spock_guide(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('A W\nE V\nC X\n')
+        try:
+            # spock beats rock (6+2), rock beats scissors (6+1), paper ties paper (3+3)
+            self.assertEqual(ROCK_PAPER_SCISSORS_LIZARD_SPOCK.score_strategy_guide(f.name), 8 + 7 + 6)
+            with self.assertRaises(ValueError):
+                ROCK_PAPER_SCISSORS.score_strategy_guide(f.name)
+        finally:
+            os.remove(f.name)
+
+    def test_symbol_mappings(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            part_one_score, part_two_score = solution.part_one_and_two(textfile)
+            symbol_mappings = ROCK_PAPER_SCISSORS.score_all_symbol_mappings(ROCK_PAPER_SCISSORS.count_rounds(textfile))
+            self.assertEqual(len(symbol_mappings), 6 + 6)
+            scores = {(m.interpretation, tuple(m.mapping.values())) : m.score for m in symbol_mappings}
+            with self.subTest(i=f'{textfile} part one mapping'):
+                self.assertEqual(scores[('shape', ('rock', 'paper', 'scissors'))], part_one_score)
+            with self.subTest(i=f'{textfile} part two mapping'):
+                self.assertEqual(scores[('outcome', ('loss', 'tie', 'win'))], part_two_score)
+            best, worst = ROCK_PAPER_SCISSORS.best_and_worst_symbol_mappings(textfile)
+            self.assertEqual(best.score, max(scores.values()))
+            self.assertEqual(worst.score, min(scores.values()))
+
+    def test_symbol_mappings_example(self):
+        best, worst = ROCK_PAPER_SCISSORS.best_and_worst_symbol_mappings(self.EXAMPLE)
+        # A Y, B X, C Z -- reading Y, X, Z as paper, scissors, rock wins every round: (6+2) + (6+3) + (6+1)
+        self.assertEqual(best, solution_np.SymbolMapping('shape', {'X': 'scissors', 'Y': 'paper', 'Z': 'rock'}, 24))
+        self.assertEqual(worst.score, 6)
+
+    def test_simulated_tournament(self):
+        always_win = [[0, 1, 0], [0, 0, 1], [1, 0, 0]]
+        for name, opponent_weights, strategy in [('uniform', None, None),
+                                                 ('weighted', [0.5, 0.3, 0.2], [0.2, 0.2, 0.6]),
+                                                 ('always win', None, always_win)]:
+            with self.subTest(i=name):
+                result = solution_np.simulate_tournament(ROCK_PAPER_SCISSORS, num_rounds=200_000, opponent_weights=opponent_weights,
+                                                         strategy=strategy, seed=1, batch_size=30_000)
+                expected = solution_np.expected_score_per_round(ROCK_PAPER_SCISSORS, opponent_weights, strategy)
+                self.assertEqual(result.num_rounds, 200_000)
+                self.assertAlmostEqual(result.mean, result.total_score / 200_000)
+                # within 5 standard errors of the exact expected value
+                self.assertLessEqual(abs(result.mean - expected), 5 * math.sqrt(result.variance / 200_000) + 1e-9)
+        # always winning against a uniform opponent: 6 + (1 + 2 + 3) / 3 every round
+        self.assertAlmostEqual(result.mean, 8, places=1)
+
+    def test_simulated_tournament_is_seeded(self):
+        first = solution_np.simulate_tournament(ROCK_PAPER_SCISSORS_LIZARD_SPOCK, num_rounds=50_000, seed=7)
+        second = solution_np.simulate_tournament(ROCK_PAPER_SCISSORS_LIZARD_SPOCK, num_rounds=50_000, seed=7)
+        self.assertEqual(first, second)
+
+    def test_simulated_tournament_needs_rounds(self):
+        for num_rounds in (0, -5):
+            with self.subTest(i=num_rounds):
+                with self.assertRaises(ValueError):
+                    solution_np.simulate_tournament(ROCK_PAPER_SCISSORS, num_rounds=num_rounds)
+
+    def test_even_number_of_shapes(self):
+        with self.assertRaises(ValueError):
+            CyclicGame(('a', 'b', 'c', 'd'), opponent_symbols='ABCD', our_symbols='WXYZ')
+
+if __name__ == '__main__':
+    unittest.main()
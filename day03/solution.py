@@ -1,3 +1,6 @@
+from functools import reduce
+from operator import and_, or_
+
 rucksackfile = 'input.txt'
 
 def prioritize_item(item):
@@ -10,6 +13,47 @@ def prioritize_item(item):
 def turn_rucksack_str_into_set(rucksack_str):
     return {item for item in rucksack_str}
 
+# Bitmask representation: bit (priority - 1) is set when the item is present, so a 52-bit int describes a whole
+# rucksack / compartment.  Intersections become bitwise ANDs, and a single-item mask's priority is its bit_length().
+ITEM_BITS = {chr(item_ord) : 1 << (prioritize_item(chr(item_ord)) - 1)
+             for item_ord in [*range(ord('a'), ord('z') + 1), *range(ord('A'), ord('Z') + 1)]}
+
+def turn_rucksack_str_into_mask(rucksack_str):
+    return reduce(or_, map(ITEM_BITS.__getitem__, rucksack_str), 0)
+
+def sum_mask_priorities(mask):
+    total_priority = 0
+    while mask:
+        priority = mask.bit_length()
+        total_priority += priority
+        mask ^= 1 << (priority - 1)
+    return total_priority
+
+def part_one_and_two_bitmask(inputfile=rucksackfile, group_size=3):
+    '''Both parts from a single read of the file, without building any sets.
+    Returns (total priority of mis-placed items, total priority of the badges).
+    '''
+    total_priority_score = 0
+    total_badge_scores = 0
+    group_mask = 0
+    current_line = 0  # counts rucksacks only, so blank lines don't shift the groups
+    with open(inputfile, 'r') as rucksack_file:
+        for rucksack_contents in rucksack_file:
+            rucksack_contents = rucksack_contents.rstrip('\n')
+            if not rucksack_contents:
+                continue
+            midpoint = len(rucksack_contents) // 2
+            compartment_one_mask = turn_rucksack_str_into_mask(rucksack_contents[:midpoint])
+            compartment_two_mask = turn_rucksack_str_into_mask(rucksack_contents[midpoint:])
+            total_priority_score += sum_mask_priorities(compartment_one_mask & compartment_two_mask)
+
+            rucksack_mask = compartment_one_mask | compartment_two_mask
+            group_mask = rucksack_mask if current_line % group_size == 0 else group_mask & rucksack_mask
+            if current_line % group_size == group_size - 1:
+                total_badge_scores += sum_mask_priorities(group_mask)
+            current_line += 1
+    return total_priority_score, total_badge_scores
+
 def part_one():
     total_priority_score = 0
     with open(rucksackfile, 'r') as rucksack_file:
@@ -23,34 +67,114 @@ def part_one():
 
     print(f'Total priority score for mis-placed items: {total_priority_score}')
 
-def part_two():
+def indices_to_bitset(indices, size):
+    bits = bytearray((size + 7) // 8)
+    for idx in indices:
+        bits[idx >> 3] |= 1 << (idx & 7)
+    return int.from_bytes(bits, 'little')
+
+def bitset_to_indices(bitset):
+    indices = []
+    for byte_idx, byte in enumerate(bitset.to_bytes((bitset.bit_length() + 7) // 8, 'little')):
+        while byte:
+            low_bit = byte & -byte
+            indices.append(8 * byte_idx + low_bit.bit_length() - 1)
+            byte ^= low_bit
+    return indices
+
+class RucksackIndex:
+    '''Index over every rucksack in a file, built from a single parse:
+        rucksack_masks -- forward index, one item mask per rucksack (see turn_rucksack_str_into_mask)
+        item_bitsets   -- inverted index, one int per item type with bit r set when rucksack r holds that item
+    Queries are bitwise operations on these ints instead of re-scanning the rucksacks and rebuilding sets.
+    '''
+    def __init__(self, rucksack_masks):
+        self.rucksack_masks = rucksack_masks
+        posting_lists = {item : [] for item in ITEM_BITS}
+        for rucksack_idx, mask in enumerate(rucksack_masks):
+            for item, bit in ITEM_BITS.items():
+                if mask & bit:
+                    posting_lists[item].append(rucksack_idx)
+        self.item_bitsets = {item : indices_to_bitset(postings, len(rucksack_masks)) for item, postings in posting_lists.items()}
+
+    @classmethod
+    def from_input_file(cls, inputfile=rucksackfile):
+        with open(inputfile, 'r') as rucksack_file:
+            return cls([turn_rucksack_str_into_mask(line.rstrip('\n')) for line in rucksack_file if line.strip()])
 
-    # Parse the file - keep a counter for which line number I'm on.
-    # Use mod to determine when a new group needs to be formed (0, 3, 6, ... 3*n % 3 = 0, otherwise 1 or 2)
+    def __len__(self):
+        return len(self.rucksack_masks)
 
-    # Once I have three elves (look for % 2 = 2), look at the intersection of the three elves' contents
+    def __repr__(self):
+        return f'RucksackIndex(num_rucksacks={len(self)})'
 
+    def rucksacks_containing_bitset(self, *items):
+        bitset = (1 << len(self)) - 1
+        for item in items:
+            bitset &= self.item_bitsets[item]
+        return bitset
+
+    def rucksacks_containing(self, *items):
+        '''Indices of the rucksacks holding every one of the given item types.'''
+        return bitset_to_indices(self.rucksacks_containing_bitset(*items))
+
+    def count_rucksacks_containing(self, *items):
+        return self.rucksacks_containing_bitset(*items).bit_count()
+
+    def group_masks(self, group_size=3):
+        '''Item types shared by every rucksack in each group.'''
+        return [reduce(and_, self.rucksack_masks[start:start + group_size])
+                for start in range(0, len(self) - group_size + 1, group_size)]
+
+    def groups_sharing_multiple_items(self, group_size=3):
+        '''{group index : shared item types} for the groups whose rucksacks share more than one item type.'''
+        return {group_idx : ''.join(item for item, bit in ITEM_BITS.items() if group_mask & bit)
+                for group_idx, group_mask in enumerate(self.group_masks(group_size)) if group_mask.bit_count() > 1}
+
+def iterate_group_badges(lines, group_size=3):
+    '''Generator -- streams rucksack lines and yields (group_index, badge, priority) once every group_size lines.
+    The running total of the badge priorities is the generator's return value (see sum_badge_priorities).
+    '''
     total_badge_scores = 0
+    group_index = 0
+    group_mask = 0
     current_line = 0
-    current_group_rucksack_content_sets = []
-    with open(rucksackfile, 'r') as rucksack_file:
-        for rucksack_contents in rucksack_file.readlines():            
-            rucksack_contents = rucksack_contents.replace('\n', '')
-            # reset
-            if current_line % 3 == 0:
-                current_group_rucksack_content_sets = []
-            # turn the current line into a set
-            current_group_rucksack_content_sets.append({item for item in rucksack_contents})
-            # if this is the third elf, come up with a badge for the prior three!
-            if current_line % 3 == 2:
-                elf_one_contents, elf_two_contents, elf_three_contents = current_group_rucksack_content_sets
-                elf_one_two_intersection = elf_one_contents.intersection(elf_two_contents)
-                badge_set = elf_one_two_intersection.intersection(elf_three_contents)  # this should be a set of one element
-                badge_letter = list(badge_set)[0]
-                print(f'\t{badge_letter}')
-                total_badge_scores += prioritize_item(badge_letter)
+    for rucksack_contents in lines:
+        rucksack_contents = rucksack_contents.rstrip('\n')
+        if not rucksack_contents:
+            continue
+        rucksack_mask = turn_rucksack_str_into_mask(rucksack_contents)
+        group_mask = rucksack_mask if current_line % group_size == 0 else group_mask & rucksack_mask
+        # if this is the last elf of the group, come up with a badge for the group!
+        if current_line % group_size == group_size - 1:
+            # should be a single item -- if not, report every item the group shares
+            badge = ''.join(item for item, bit in ITEM_BITS.items() if group_mask & bit)
+            priority = sum_mask_priorities(group_mask)
+            total_badge_scores += priority
+            yield group_index, badge, priority
+            group_index += 1
+        current_line += 1
+    return total_badge_scores
 
-            current_line += 1
+def sum_badge_priorities(badges, on_badge=None):
+    '''Drains a badge generator and returns its total.  on_badge (ex: print_badge) is an opt-in consumer per badge.'''
+    while True:
+        try:
+            group_index, badge, priority = next(badges)
+        except StopIteration as stop:
+            return stop.value
+        if on_badge:
+            on_badge(group_index, badge, priority)
+
+def print_badge(group_index, badge, priority):
+    print(f'\t{badge}')
+
+def part_two(printbadges=False, group_size=3):
+    # Stream the file and intersect each group's rucksacks as they go by (see iterate_group_badges).
+    # Printing every badge is opt-in -- for big files the terminal output, not the intersections, is the bottleneck.
+    with open(rucksackfile, 'r') as rucksack_file:
+        badges = iterate_group_badges(rucksack_file, group_size)
+        total_badge_scores = sum_badge_priorities(badges, on_badge=print_badge if printbadges else None)
     print(f'Total of the badge scores: {total_badge_scores}')
 
 if __name__ == '__main__':
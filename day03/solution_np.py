@@ -0,0 +1,109 @@
+# std library
+import os
+# third-party
+import numpy as np
+
+'''
+Vectorized rucksack engine -- the file is handled as one byte buffer instead of line-by-line.
+
+    1. every byte -> its priority with a 256-entry lookup table (anything that isn't an item, like '\n', -> 0)
+    2. priority -> item bit, bit (priority - 1) of a 52-bit mask  (priority 0 -> no bit)
+    3. line boundaries + midpoints split the buffer into compartments, and np.bitwise_or.reduceat
+       turns each compartment's item bits into its presence mask in one segmented reduction
+    4. part one = AND of the two compartment masks, part two = AND over each group of rucksack masks
+'''
+
+NEWLINE = ord('\n')
+CARRIAGE_RETURN = ord('\r')
+CHUNK_SIZE = 1 << 24  # bytes per step, bounds the temporary arrays (the mask array is 8 bytes per input byte)
+
+PRIORITY_LUT = np.zeros(256, dtype=np.uint8)
+PRIORITY_LUT[ord('a'):ord('z') + 1] = np.arange(1, 27)
+PRIORITY_LUT[ord('A'):ord('Z') + 1] = np.arange(27, 53)
+
+PRIORITY_BITS = np.zeros(53, dtype=np.uint64)
+PRIORITY_BITS[1:] = np.left_shift(np.uint64(1), np.arange(52, dtype=np.uint64))
+
+def sum_mask_priorities(masks):
+    '''Sum of the priorities of every set bit, over an array of masks (one pass per bit, not per mask).'''
+    total_priority = 0
+    for bit in range(52):
+        total_priority += (bit + 1) * int(np.count_nonzero((masks >> np.uint64(bit)) & np.uint64(1)))
+    return total_priority
+
+def rucksack_line_bounds(buf):
+    '''(start, end) index arrays of the non-blank lines in buf -- end excludes the '\n' or '\r\n'.'''
+    newlines = np.flatnonzero(buf == NEWLINE)
+    line_starts = np.empty_like(newlines)
+    line_starts[:1] = 0
+    line_starts[1:] = newlines[:-1] + 1
+    line_ends = newlines - (buf[np.maximum(newlines - 1, 0)] == CARRIAGE_RETURN)
+    is_rucksack = line_ends > line_starts
+    return line_starts[is_rucksack], line_ends[is_rucksack]
+
+def compartment_masks_for_chunk(chunk):
+    '''chunk = bytes of complete, newline-terminated lines -> (compartment one masks, compartment two masks), one per rucksack.'''
+    item_bits = PRIORITY_BITS[PRIORITY_LUT[chunk]]
+
+    line_starts, line_ends = rucksack_line_bounds(chunk)
+    midpoints = line_starts + (line_ends - line_starts) // 2
+
+    # segments alternate [start, midpoint), [midpoint, next start) -- the second one also covers the line ending
+    # (and any blank lines), but those bytes have no item bit so they don't change the OR.
+    segment_starts = np.empty(2 * len(line_starts), dtype=line_starts.dtype)
+    segment_starts[0::2] = line_starts
+    segment_starts[1::2] = midpoints
+    compartment_masks = np.bitwise_or.reduceat(item_bits, segment_starts)
+    # reduceat gives item_bits[start] for an empty segment, not 0 -- a 1-item line has an empty first compartment
+    compartment_one_masks = np.where(midpoints == line_starts, np.uint64(0), compartment_masks[0::2])
+    return compartment_one_masks, compartment_masks[1::2]
+
+def iterate_chunks(inputfile, group_size, chunk_size=CHUNK_SIZE):
+    '''Memory-maps the file and yields newline-terminated chunks holding a multiple of group_size rucksacks,
+    so no group is split between chunks.
+    '''
+    if os.path.getsize(inputfile) == 0:
+        return
+    buf = np.memmap(inputfile, dtype=np.uint8, mode='r')
+    chunk_start = 0
+    while chunk_start < len(buf):
+        chunk_end = len(buf)
+        if chunk_start + chunk_size < len(buf):
+            window = np.asarray(buf[chunk_start:chunk_start + chunk_size])
+            # only count complete lines of the window, and ignore blank lines
+            window = window[:window.size - np.argmax(window[::-1] == NEWLINE)]
+            _, rucksack_line_ends = rucksack_line_bounds(window)
+            num_whole_groups = len(rucksack_line_ends) // group_size
+            if num_whole_groups:
+                last_line_end = rucksack_line_ends[num_whole_groups * group_size - 1]
+                chunk_end = chunk_start + last_line_end + np.argmax(window[last_line_end:] == NEWLINE) + 1
+        chunk = np.asarray(buf[chunk_start:chunk_end])
+        # the last line of the file might not have a trailing newline
+        if chunk[-1] != NEWLINE:
+            chunk = np.append(chunk, np.uint8(NEWLINE))
+        yield chunk
+        chunk_start = chunk_end
+
+def part_one_and_two(inputfile, group_size=3, chunk_size=CHUNK_SIZE):
+    '''Returns (total priority of mis-placed items, total priority of the badges).
+    Part one counts every rucksack; a trailing group with fewer than group_size rucksacks has no badge.
+    '''
+    total_priority_score = 0
+    total_badge_scores = 0
+    for chunk in iterate_chunks(inputfile, group_size, chunk_size):
+        compartment_one_masks, compartment_two_masks = compartment_masks_for_chunk(chunk)
+        total_priority_score += sum_mask_priorities(compartment_one_masks & compartment_two_masks)
+
+        # only the last chunk can end with a partial group -- like the other engines, it gets no badge
+        rucksack_masks = compartment_one_masks | compartment_two_masks
+        num_grouped = len(rucksack_masks) - len(rucksack_masks) % group_size
+        badge_masks = np.bitwise_and.reduce(rucksack_masks[:num_grouped].reshape(-1, group_size), axis=1)
+        total_badge_scores += sum_mask_priorities(badge_masks)
+    return total_priority_score, total_badge_scores
+
+if __name__ == '__main__':
+    for rucksackfile in ['example.txt', 'input.txt']:
+        total_priority_score, total_badge_scores = part_one_and_two(rucksackfile)
+        print(f'--- {rucksackfile}')
+        print(f'Total priority score for mis-placed items: {total_priority_score}')
+        print(f'Total of the badge scores: {total_badge_scores}')
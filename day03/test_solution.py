@@ -0,0 +1,87 @@
+# std library
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+# local
+import solution
+import solution_np
+
+class TestDay03(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_item_masks(self):
+        for item, bit in solution.ITEM_BITS.items():
+            with self.subTest(i=item):
+                self.assertEqual(bit.bit_length(), solution.prioritize_item(item))
+        self.assertEqual(solution.turn_rucksack_str_into_mask('aaZ'), (1 << 0) | (1 << 51))
+        self.assertEqual(solution.sum_mask_priorities(solution.turn_rucksack_str_into_mask('aBz')), 1 + 28 + 26)
+
+    def test_bitmask_answers(self):
+        self.assertEqual(solution.part_one_and_two_bitmask(self.EXAMPLE), (157, 70))
+        self.assertEqual(solution.part_one_and_two_bitmask(self.INPUT), (7691, 2508))
+
+    def test_blank_line_in_the_middle(self):
+        with open(self.EXAMPLE, 'r') as exfile:
+            lines = exfile.readlines()
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.writelines(lines[:4] + ['\n'] + lines[4:])
+        try:
+            with open(f.name, 'r') as blankfile:
+                badge_scores = solution.sum_badge_priorities(solution.iterate_group_badges(blankfile))
+            self.assertEqual(solution.part_one_and_two_bitmask(f.name), (157, 70))
+            self.assertEqual(solution_np.part_one_and_two(f.name), (157, 70))
+            self.assertEqual(badge_scores, 70)
+        finally:
+            os.remove(f.name)
+
+    def test_group_badges(self):
+        with open(self.EXAMPLE, 'r') as exfile:
+            badges = list(solution.iterate_group_badges(exfile))
+        self.assertEqual(badges, [(0, 'r', 18), (1, 'Z', 52)])
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            with self.subTest(i=textfile), open(textfile, 'r') as f:
+                self.assertEqual(solution.sum_badge_priorities(solution.iterate_group_badges(f)),
+                                 solution.part_one_and_two_bitmask(textfile)[1])
+
+    def test_group_badges_other_group_sizes(self):
+        # group of 2 -- every pair shares 'a', the last pair also shares 'B'
+        lines = ['abc\n', 'xay\n', 'aB\n', 'Ba\n']
+        self.assertEqual(list(solution.iterate_group_badges(iter(lines), group_size=2)), [(0, 'a', 1), (1, 'aB', 1 + 28)])
+        # group of 1 -- every rucksack is its own badge set
+        self.assertEqual(solution.sum_badge_priorities(solution.iterate_group_badges(iter(['a\n', 'b\n']), group_size=1)), 3)
+
+    def test_badge_printing_is_opt_in(self):
+        with open(self.EXAMPLE, 'r') as exfile, contextlib.redirect_stdout(io.StringIO()) as out:
+            solution.sum_badge_priorities(solution.iterate_group_badges(exfile))
+        self.assertEqual(out.getvalue(), '')
+        with open(self.EXAMPLE, 'r') as exfile, contextlib.redirect_stdout(io.StringIO()) as out:
+            total = solution.sum_badge_priorities(solution.iterate_group_badges(exfile), on_badge=solution.print_badge)
+        self.assertEqual(out.getvalue(), '\tr\n\tZ\n')
+        self.assertEqual(total, 70)
+
+    def test_rucksack_index(self):
+        with open(self.INPUT, 'r') as inputfile:
+            rucksack_sets = [solution.turn_rucksack_str_into_set(line.rstrip('\n')) for line in inputfile]
+        index = solution.RucksackIndex.from_input_file(self.INPUT)
+        self.assertEqual(len(index), len(rucksack_sets))
+        for items in ['a', 'Z', 'pL', 'vrs']:
+            with self.subTest(i=items):
+                expected = [i for i, rucksack in enumerate(rucksack_sets) if rucksack.issuperset(items)]
+                self.assertEqual(index.rucksacks_containing(*items), expected)
+                self.assertEqual(index.count_rucksacks_containing(*items), len(expected))
+        # every group in the puzzle input shares exactly one item type (its badge)
+        self.assertEqual(index.groups_sharing_multiple_items(), {})
+        self.assertEqual(sum(solution.sum_mask_priorities(mask) for mask in index.group_masks()), 2508)
+
+    def test_groups_sharing_multiple_items(self):
+        index = solution.RucksackIndex([solution.turn_rucksack_str_into_mask(s) for s in ['abc', 'bca', 'abx', 'zQ', 'Qz', 'Q']])
+        self.assertEqual(index.groups_sharing_multiple_items(), {0: 'ab'})
+        self.assertEqual(index.rucksacks_containing('Q', 'z'), [3, 4])
+        self.assertEqual(index.rucksacks_containing(), [0, 1, 2, 3, 4, 5])
+
+if __name__ == '__main__':
+    unittest.main()
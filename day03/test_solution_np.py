@@ -0,0 +1,61 @@
+# std library
+import os
+import tempfile
+import unittest
+# local
+import solution
+import solution_np
+
+class TestDay03Numpy(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_priority_lut_matches_prioritize_item(self):
+        for item in solution.ITEM_BITS:
+            with self.subTest(i=item):
+                self.assertEqual(solution_np.PRIORITY_LUT[ord(item)], solution.prioritize_item(item))
+        self.assertEqual(solution_np.PRIORITY_LUT[ord('\n')], 0)
+
+    def test_answers_match_bitmask_engine(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            # small chunk sizes force several chunks per file
+            for chunk_size in (50, 1000, solution_np.CHUNK_SIZE):
+                with self.subTest(i=f'{textfile} chunk_size={chunk_size}'):
+                    self.assertEqual(solution_np.part_one_and_two(textfile, chunk_size=chunk_size),
+                                     solution.part_one_and_two_bitmask(textfile))
+
+    def test_single_item_rucksacks(self):
+        # a 1-item rucksack has an empty first compartment, so nothing can be mis-placed
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('a\nb\na\n')
+        try:
+            self.assertEqual(solution_np.part_one_and_two(f.name), solution.part_one_and_two_bitmask(f.name))
+            self.assertEqual(solution_np.part_one_and_two(f.name), (0, 0))
+        finally:
+            os.remove(f.name)
+
+    def test_trailing_partial_group(self):
+        # 4 rucksacks in groups of 3 -- the last one is still scored for part one, but gets no badge
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('aa\nab\nac\nZZ\n')
+        try:
+            for chunk_size in (4, solution_np.CHUNK_SIZE):
+                with self.subTest(i=f'chunk_size={chunk_size}'):
+                    self.assertEqual(solution_np.part_one_and_two(f.name, chunk_size=chunk_size), (1 + 52, 1))
+            self.assertEqual(solution.part_one_and_two_bitmask(f.name), (1 + 52, 1))
+        finally:
+            os.remove(f.name)
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('ab\ncd\n')
+        try:
+            self.assertEqual(solution_np.part_one_and_two(f.name), solution.part_one_and_two_bitmask(f.name))
+            self.assertEqual(solution_np.part_one_and_two(f.name), (0, 0))
+        finally:
+            os.remove(f.name)
+
+    def test_example_answers(self):
+        self.assertEqual(solution_np.part_one_and_two(self.EXAMPLE), (157, 70))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,45 +1,149 @@
+import bisect
 import re
+from collections import namedtuple
 
-def part_one(raw_data):
+# Each elf's assignment is an inclusive range of section IDs.  Only the endpoints are stored,
+# so containment / overlap checks are O(1) no matter how many sections the range covers.
+class Interval(namedtuple('Interval', ['start', 'end'])):
+    __slots__ = ()
+
+    def __str__(self):
+        return f'{self.start}-{self.end}'
+
+    def contains(self, other):
+        return self.start <= other.start and other.end <= self.end
+
+    def overlaps(self, other):
+        return self.start <= other.end and other.start <= self.end
+
+def read_input_file_into_assignment_pairs(inputfile):
+    # Structure of input data
+    # a-b,c-d
+    #   where each pair of numbers separated by hyphens indicates the range of ID numbers (a (inclusive) to b (inclusive))
+    #   and two ID ranges are given per line, since the elves are paired up.
+    #
+    # assignment_pairs structure:
+    #   - list of tuples
+    #   - each tuple represents the pair of elves (and therefore has two elements)
+    #   - the two elements are the Intervals of ids for which the elves are responsible
+    assignment_pairs = []
+    parser = re.compile(r"(\d+)-(\d+),(\d+)-(\d+)")
+    with open(inputfile, 'r') as _inputfile:
+        for line in _inputfile.readlines():
+            elf1_start, elf1_end, elf2_start, elf2_end = map(int, parser.search(line).groups())
+            assignment_pairs.append((Interval(elf1_start, elf1_end), Interval(elf2_start, elf2_end)))
+    return assignment_pairs
+
+class CoverageIndex:
+    '''Index over every assignment in a file, built once from the sorted interval endpoints.
+        num_sections_covered     -- distinct sections covered by any elf          O(1)  (merged once at build time)
+        num_elves_covering(x)    -- how many assignments include section x        O(log n)  (sweep-line count via bisect)
+        pairs_touching(lo, hi)   -- pairs with an assignment overlapping [lo, hi]  O(log n) per reported assignment
+    '''
+    def __init__(self, assignment_pairs):
+        # every assignment, tagged with the index of the pair (line) it came from, ordered by start
+        assignments = sorted((interval.start, interval.end, pair_idx)
+                             for pair_idx, pair in enumerate(assignment_pairs) for interval in pair)
+        self.starts   = [start for start, _, _ in assignments]
+        self.ends     = [end for _, end, _ in assignments]
+        self.pair_ids = [pair_idx for _, _, pair_idx in assignments]
+        self.sorted_ends = sorted(self.ends)
+
+        # sweep over the starts, merging overlapping / adjacent assignments into disjoint coverage intervals
+        self.coverage = []
+        for start, end in zip(self.starts, self.ends):
+            if self.coverage and start <= self.coverage[-1].end + 1:
+                if end > self.coverage[-1].end:
+                    self.coverage[-1] = Interval(self.coverage[-1].start, end)
+            else:
+                self.coverage.append(Interval(start, end))
+        self.num_sections_covered = sum(interval.end - interval.start + 1 for interval in self.coverage)
+
+        # max-end segment tree over the start-ordered assignments, for pairs_touching()
+        self.leaf_offset = 1
+        while self.leaf_offset < len(self.ends):
+            self.leaf_offset *= 2
+        self.max_end_tree = [float('-inf')] * (2 * self.leaf_offset)
+        self.max_end_tree[self.leaf_offset:self.leaf_offset + len(self.ends)] = self.ends
+        for node in reversed(range(1, self.leaf_offset)):
+            self.max_end_tree[node] = max(self.max_end_tree[2 * node], self.max_end_tree[2 * node + 1])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def num_elves_covering(self, section):
+        # started at or before the section, minus ended before it
+        return bisect.bisect_right(self.starts, section) - bisect.bisect_left(self.sorted_ends, section)
+
+    def pairs_touching(self, lo, hi):
+        '''Sorted indices of the pairs where at least one elf's assignment overlaps sections [lo, hi].'''
+        # only assignments starting at or before hi can overlap -- a prefix of the start-ordered list.
+        # within that prefix, descend the tree only into subtrees holding an assignment that ends at or after lo.
+        num_candidates = bisect.bisect_right(self.starts, hi)
+        pair_ids = set()
+        stack = [(1, 0, self.leaf_offset)]  # (node, first leaf, one past last leaf)
+        while stack:
+            node, first, last = stack.pop()
+            if first >= num_candidates or self.max_end_tree[node] < lo:
+                continue
+            if node >= self.leaf_offset:
+                pair_ids.add(self.pair_ids[first])
+                continue
+            middle = (first + last) // 2
+            stack.append((2 * node, first, middle))
+            stack.append((2 * node + 1, middle, last))
+        return sorted(pair_ids)
+
+def count_globally_contained_assignments(assignment_pairs):
+    '''How many assignments, across the whole file, are fully contained in some other assignment?  O(n log n)
+    Sorted by start (ties: longest first), every assignment that could contain the current one comes before it,
+    so it's enough to compare against the furthest end seen so far.  Identical assignments contain each other.
+    '''
+    assignments = sorted((interval for pair in assignment_pairs for interval in pair), key=lambda interval: (interval.start, -interval.end))
+    contained_counter = 0
+    max_end_so_far = float('-inf')
+    for i, interval in enumerate(assignments):
+        has_duplicate = (i > 0 and assignments[i-1] == interval) or (i + 1 < len(assignments) and assignments[i+1] == interval)
+        if interval.end <= max_end_so_far or has_duplicate:
+            contained_counter += 1
+        max_end_so_far = max(max_end_so_far, interval.end)
+    return contained_counter
+
+def count_globally_overlapping_assignment_pairs(assignment_pairs):
+    '''How many pairs of assignments, across the whole file, overlap?  O(n log n)
+    Counted as all pairs minus the disjoint ones -- a disjoint pair is counted once, from the assignment that
+    ends first, as the number of assignments starting after it ends (bisect over the sorted starts).
+    '''
+    assignments = [interval for pair in assignment_pairs for interval in pair]
+    sorted_starts = sorted(interval.start for interval in assignments)
+    num_assignments = len(assignments)
+    disjoint_counter = sum(num_assignments - bisect.bisect_right(sorted_starts, interval.end) for interval in assignments)
+    return num_assignments * (num_assignments - 1) // 2 - disjoint_counter
+
+def part_one(assignment_pairs):
     # Question: In how many assignment pairs does one range fully contain the other?
-    #   To answer this, we can use set properties!
     subset_counter = 0
-    for elf1_id_set, elf2_id_set in raw_data:
-        if elf1_id_set.issuperset(elf2_id_set) or elf2_id_set.issuperset(elf1_id_set):
+    for elf1_interval, elf2_interval in assignment_pairs:
+        if elf1_interval.contains(elf2_interval) or elf2_interval.contains(elf1_interval):
             subset_counter += 1
     print(f"Part 1: number of elf pairs where one elf's responsibilities are a subset of the other's: {subset_counter}")
+    return subset_counter
 
-def part_two(raw_data):
+def part_two(assignment_pairs):
     # Question: In how many assignment pairs do the ranges overlap at all?
     intersection_counter = 0
-    for elf1_id_set, elf2_id_set in raw_data:
-        if len(elf1_id_set.intersection(elf2_id_set)) > 0:
+    for elf1_interval, elf2_interval in assignment_pairs:
+        if elf1_interval.overlaps(elf2_interval):
             intersection_counter += 1
     print(f"Part 2: number of elf pairs with any intersection of responsibilities: {intersection_counter}")
+    return intersection_counter
 
 if __name__ == '__main__':
-    
+
     for inputfile in ['example.txt', 'input.txt']:
         print(f'--- {inputfile}')
-
-        # Structure of input data
-        # a-b,c-d
-        #   where each pair of numbers separated by hyphens indicates the range of ID numbers (a (inclusive) to b (inclusive))
-        #   and two ID ranges are given per line, since the elves are paired up.
-        raw_data = []
-        parser = re.compile(r"(\d+)-(\d+),(\d+)-(\d+)")
-        with open(inputfile, 'r') as _inputfile:
-            for line in _inputfile.readlines():
-                elf1_start, elf1_end, elf2_start, elf2_end = map(int, parser.search(line).groups())
-
-                # raw_data structure:
-                #   - list of lists
-                #   - each list represents the pair of elves (and therefore has two elements)
-                #   - the two elements are sets of ids for which the elves are responsible
-                raw_data.append([
-                    {id for id in range(elf1_start, elf1_end + 1)},
-                    {id for id in range(elf2_start, elf2_end + 1)}
-                ])
-                
-        part_one(raw_data)
-        part_two(raw_data)
\ No newline at end of file
+        assignment_pairs = read_input_file_into_assignment_pairs(inputfile)
+        part_one(assignment_pairs)
+        part_two(assignment_pairs)
+        print(f"Whole file: assignments contained in another assignment: {count_globally_contained_assignments(assignment_pairs)}")
+        print(f"Whole file: pairs of overlapping assignments: {count_globally_overlapping_assignment_pairs(assignment_pairs)}")
@@ -0,0 +1,55 @@
+# third-party
+import numpy as np
+
+'''
+Vectorized engine for day 04 -- every line "a-b,c-d" becomes one row of an (N, 4) int array.
+
+Parsing doesn't look at lines at all: the numbers are the runs of digit bytes in the file, found with one
+comparison + diff over the whole byte buffer, and converted one digit column at a time (value*10 + digit)
+across every number at once.  Both answers are then boolean-mask reductions over the columns.
+'''
+
+ZERO = ord('0')
+NINE = ord('9')
+
+def parse_input_file_into_assignment_array(inputfile):
+    '''Returns an (N, 4) int64 array, one row per elf pair: elf1_start, elf1_end, elf2_start, elf2_end.'''
+    buf = np.fromfile(inputfile, dtype=np.uint8)
+    is_digit = (buf >= ZERO) & (buf <= NINE)
+    # a number starts where is_digit switches on, and ends where it switches off
+    edges = np.diff(is_digit.astype(np.int8), prepend=np.int8(0), append=np.int8(0))
+    number_starts = np.flatnonzero(edges == 1)
+    number_lengths = np.flatnonzero(edges == -1) - number_starts
+
+    numbers = np.zeros(len(number_starts), dtype=np.int64)
+    for column in range(number_lengths.max(initial=0)):
+        has_digit = number_lengths > column
+        digits = buf[np.minimum(number_starts + column, len(buf) - 1)].astype(np.int64) - ZERO
+        numbers = np.where(has_digit, numbers * 10 + digits, numbers)
+
+    if len(numbers) % 4:
+        raise ValueError(f'{inputfile}: expected 4 numbers per line, found {len(numbers)} numbers in total')
+    return numbers.reshape(-1, 4)
+
+def count_contained_pairs(assignments):
+    '''Part one -- pairs where one range fully contains the other.'''
+    elf1_start, elf1_end, elf2_start, elf2_end = assignments.T
+    elf1_contains_elf2 = (elf1_start <= elf2_start) & (elf2_end <= elf1_end)
+    elf2_contains_elf1 = (elf2_start <= elf1_start) & (elf1_end <= elf2_end)
+    return int(np.count_nonzero(elf1_contains_elf2 | elf2_contains_elf1))
+
+def count_overlapping_pairs(assignments):
+    '''Part two -- pairs whose ranges overlap at all.'''
+    elf1_start, elf1_end, elf2_start, elf2_end = assignments.T
+    return int(np.count_nonzero((elf1_start <= elf2_end) & (elf2_start <= elf1_end)))
+
+def part_one_and_two(inputfile):
+    assignments = parse_input_file_into_assignment_array(inputfile)
+    return count_contained_pairs(assignments), count_overlapping_pairs(assignments)
+
+if __name__ == '__main__':
+    for inputfile in ['example.txt', 'input.txt']:
+        print(f'--- {inputfile}')
+        subset_counter, intersection_counter = part_one_and_two(inputfile)
+        print(f"Part 1: number of elf pairs where one elf's responsibilities are a subset of the other's: {subset_counter}")
+        print(f"Part 2: number of elf pairs with any intersection of responsibilities: {intersection_counter}")
@@ -0,0 +1,84 @@
+# std library
+import contextlib
+import io
+import unittest
+# local
+import solution
+from solution import Interval
+
+class TestDay04(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_file_parsing(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            with self.subTest(i=textfile):
+                assignment_pairs = solution.read_input_file_into_assignment_pairs(textfile)
+                with open(textfile, 'r') as f:
+                    self.assertEqual(f.read().splitlines(), [f'{elf1},{elf2}' for elf1, elf2 in assignment_pairs])
+
+    def test_interval_checks_match_sets(self):
+        intervals = [Interval(start, end) for start in range(1, 7) for end in range(start, 7)]
+        for a in intervals:
+            a_set = set(range(a.start, a.end + 1))
+            for b in intervals:
+                b_set = set(range(b.start, b.end + 1))
+                with self.subTest(i=f'{a} {b}'):
+                    self.assertEqual(a.contains(b), a_set.issuperset(b_set))
+                    self.assertEqual(a.overlaps(b), len(a_set & b_set) > 0)
+
+    def test_wide_ranges(self):
+        self.assertTrue(Interval(1, 10**9).contains(Interval(5, 10**9 - 5)))
+        self.assertFalse(Interval(1, 10**9).overlaps(Interval(10**9 + 1, 10**12)))
+
+    def test_coverage_index(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            assignment_pairs = solution.read_input_file_into_assignment_pairs(textfile)
+            index = solution.CoverageIndex(assignment_pairs)
+            assignments = [(pair_idx, interval) for pair_idx, pair in enumerate(assignment_pairs) for interval in pair]
+            sections = {section for _, interval in assignments for section in range(interval.start, interval.end + 1)}
+            with self.subTest(i=f'{textfile} sections covered'):
+                self.assertEqual(index.num_sections_covered, len(sections))
+            for section in range(0, max(sections) + 2):
+                with self.subTest(i=f'{textfile} section {section}'):
+                    self.assertEqual(index.num_elves_covering(section),
+                                     sum(interval.start <= section <= interval.end for _, interval in assignments))
+            for lo, hi in [(0, 0), (1, 1), (5, 7), (10, 20), (50, 50), (90, 200)]:
+                with self.subTest(i=f'{textfile} range {lo}-{hi}'):
+                    self.assertEqual(index.pairs_touching(lo, hi),
+                                     sorted({pair_idx for pair_idx, interval in assignments if interval.overlaps(Interval(lo, hi))}))
+
+    def test_coverage_index_example(self):
+        index = solution.CoverageIndex(solution.read_input_file_into_assignment_pairs(self.EXAMPLE))
+        self.assertEqual(index.coverage, [Interval(2, 9)])
+        self.assertEqual(index.num_elves_covering(6), 8)
+        self.assertEqual(index.pairs_touching(9, 12), [2])
+
+    def test_global_counts(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            assignment_pairs = solution.read_input_file_into_assignment_pairs(textfile)
+            assignments = [interval for pair in assignment_pairs for interval in pair]
+            # naive all-pairs comparison as the oracle
+            contained = sum(any(j != i and other.contains(interval) for j, other in enumerate(assignments))
+                            for i, interval in enumerate(assignments))
+            overlapping = sum(assignments[i].overlaps(assignments[j])
+                              for i in range(len(assignments)) for j in range(i + 1, len(assignments)))
+            with self.subTest(i=textfile):
+                self.assertEqual(solution.count_globally_contained_assignments(assignment_pairs), contained)
+                self.assertEqual(solution.count_globally_overlapping_assignment_pairs(assignment_pairs), overlapping)
+
+    def test_global_counts_duplicates(self):
+        assignment_pairs = [(Interval(1, 5), Interval(1, 5)), (Interval(2, 3), Interval(7, 9))]
+        # both copies of 1-5 contain each other, 2-3 is inside 1-5, 7-9 is on its own
+        self.assertEqual(solution.count_globally_contained_assignments(assignment_pairs), 3)
+        self.assertEqual(solution.count_globally_overlapping_assignment_pairs(assignment_pairs), 3)
+
+    def test_answers(self):
+        for textfile, answers in [(self.EXAMPLE, (2, 4)), (self.INPUT, (532, 854))]:
+            with self.subTest(i=textfile), contextlib.redirect_stdout(io.StringIO()):
+                assignment_pairs = solution.read_input_file_into_assignment_pairs(textfile)
+                self.assertEqual((solution.part_one(assignment_pairs), solution.part_two(assignment_pairs)), answers)
+
+if __name__ == '__main__':
+    unittest.main()
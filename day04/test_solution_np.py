@@ -0,0 +1,32 @@
+# std library
+import contextlib
+import io
+import unittest
+# local
+import solution
+import solution_np
+
+class TestDay04Numpy(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def test_file_parsing(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            with self.subTest(i=textfile):
+                assignment_pairs = solution.read_input_file_into_assignment_pairs(textfile)
+                self.assertEqual(solution_np.parse_input_file_into_assignment_array(textfile).tolist(),
+                                 [[*elf1, *elf2] for elf1, elf2 in assignment_pairs])
+
+    def test_answers_match_interval_engine(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            with self.subTest(i=textfile), contextlib.redirect_stdout(io.StringIO()):
+                assignment_pairs = solution.read_input_file_into_assignment_pairs(textfile)
+                self.assertEqual(solution_np.part_one_and_two(textfile),
+                                 (solution.part_one(assignment_pairs), solution.part_two(assignment_pairs)))
+
+    def test_example_answers(self):
+        self.assertEqual(solution_np.part_one_and_two(self.EXAMPLE), (2, 4))
+
+if __name__ == '__main__':
+    unittest.main()
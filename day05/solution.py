@@ -1,9 +1,51 @@
-import copy
 import re
-from collections import namedtuple
+import sys
+from collections import deque, namedtuple
 from pprint import pprint
 
 
+Move = namedtuple('Move', ['num_crates', 'pos_from', 'pos_to'])
+# final top crates of both cranes' boards, and how many moves the move list optimizer saved each crane
+StreamingResult = namedtuple('StreamingResult', ['top_crates_9000', 'top_crates_9001', 'num_removed_9000', 'num_removed_9001'])
+MAX_PENDING_MOVES = 1000  # moves held back while streaming, so they can still fuse with the moves that follow
+
+class CrateBoard:
+    '''Crate board where each stack is a bytearray of single-character crate names (bottom -> top), 1 byte per crate.
+    Indexing gives the stack itself, so the cranes' slice moves work on it unchanged (bytearray slices are memcpy's),
+    and copying the board is one bytearray copy per stack -- O(total crates), no deepcopy of per-crate objects.
+    '''
+    def __init__(self, stacks):
+        self.stacks = [bytearray(stack) for stack in stacks]
+
+    @classmethod
+    def from_crate_lists(cls, crate_board):
+        '''From the list-of-lists board made by crate_lines_to_board().'''
+        return cls(''.join(stack).encode() for stack in crate_board)
+
+    def __len__(self):
+        return len(self.stacks)
+
+    def __getitem__(self, idx):
+        return self.stacks[idx]
+
+    def __iter__(self):
+        return iter(self.stacks)
+
+    def __eq__(self, other):
+        return isinstance(other, CrateBoard) and self.stacks == other.stacks
+
+    def __repr__(self):
+        return f"CrateBoard([{', '.join(repr(stack.decode()) for stack in self.stacks)}])"
+
+    def copy(self):
+        return CrateBoard(self.stacks)
+
+    def crate(self, idx, height):
+        return chr(self.stacks[idx][height])
+
+    def top_crates(self):
+        return ''.join(chr(stack[-1]) for stack in self.stacks if stack)
+
 def crate_print(string):
     print(string, end='')
 def print_crate_board(crate_board):
@@ -17,7 +59,7 @@ def print_crate_board(crate_board):
             if height > len(crate_board[stack])-1:
                 crate_print('   ')  # no crate, 3 spaces
             else:
-                crate_print(f'[{crate_board[stack][height]}]')
+                crate_print(f'[{crate_board.crate(stack, height)}]')
             crate_print(' ')
         crate_print('\n')
     # ... then print the stack designators
@@ -27,6 +69,41 @@ def print_crate_board(crate_board):
             crate_print(' ')
     crate_print('\n')
 
+class CrateBoardRenderer:
+    '''Buffered alternative to print_crate_board() -- same printout, but each frame is built as one string
+    and written with a single call, instead of one print() per cell.
+    Every stack's cells are cached as a column, and only the columns of the stacks touched by the last move
+    get re-rendered; a frame is then just the cached columns joined row by row.
+    '''
+    EMPTY_CELL = '    '  # no crate, 3 spaces + separator
+
+    def __init__(self, crate_board, output=None):
+        self.crate_board = crate_board
+        self.output = output  # None = whatever sys.stdout is at write time
+        self.columns = [self.render_column(idx) for idx in range(len(crate_board))]
+        # the stack designators never change
+        self.footer = ' '.join(f' {idx + 1} ' for idx in range(len(crate_board))) + '\n'
+
+    def render_column(self, idx):
+        '''Cells of one stack, bottom -> top.'''
+        return [f'[{crate}] ' for crate in self.crate_board[idx].decode()]
+
+    def update(self, touched_stacks):
+        for idx in set(touched_stacks):
+            self.columns[idx] = self.render_column(idx)
+
+    def frame(self):
+        max_height = max((len(column) for column in self.columns), default=0)
+        rows = [
+            ''.join(column[height] if height < len(column) else self.EMPTY_CELL for column in self.columns) + '\n'
+            for height in reversed(range(max_height))
+        ]
+        return ''.join(rows) + self.footer
+
+    def render(self, touched_stacks=(), header=''):
+        self.update(touched_stacks)
+        (self.output or sys.stdout).write(header + self.frame())
+
 def crate_lines_to_board(crate_lines):
     # Input
     # -----
@@ -58,73 +135,271 @@ def crate_lines_to_board(crate_lines):
 
     return crate_board
 
-def read_file(inputfile):
-    
-    Move = namedtuple('Move', ['num_crates', 'pos_from', 'pos_to'])
+def read_crate_board(_inputfile):
+    '''Reads the crate board lines from an open file, up to and including the blank line that follows them.'''
+    crate_lines = []
+    for line in _inputfile:
+        if line == '\n':
+            break
+        crate_lines.append(line.replace('\n', ''))
+    return CrateBoard.from_crate_lists(crate_lines_to_board(crate_lines))
+
+def iterate_moves(_inputfile):
+    '''Generator -- parses the remaining lines of an open file into Moves, one at a time.'''
     parser_rawmove = re.compile(r"move (\d+) from (\d+) to (\d+)")
+    for line in _inputfile:
+        if not line.strip():
+            continue
+        _num, _from, _to = map(int, parser_rawmove.search(line).groups())
+        yield Move(_num, _from, _to)
 
-    crate_lines = []
-    crate_board = []
-    move_list = []
+def read_file(inputfile):
+    with open(inputfile, 'r') as _inputfile:
+        crate_board = read_crate_board(_inputfile)
+        move_list = list(iterate_moves(_inputfile))
+    return crate_board, move_list
 
-    done_with_crate_board = False
+def apply_moves_streaming_both_cranes(inputfile, max_pending_moves=MAX_PENDING_MOVES):
+    '''Single read of the file: each move is parsed lazily and applied to a CrateMover 9000 board and a
+    CrateMover 9001 board in the same pass, so memory is bounded by the two boards (no move list is kept).
+    Each crane's moves go through the move list optimizer on the way (see push_optimized_move): the last
+    max_pending_moves optimized moves are held back so they can still fuse with the next ones, and the oldest
+    is applied once there are more.
+    Returns a StreamingResult.
+    '''
+    num_moves = 0
     with open(inputfile, 'r') as _inputfile:
-        for line in _inputfile.readlines():
-            if line == '\n':
-                done_with_crate_board = True
-                crate_board = crate_lines_to_board(crate_lines)
-            elif not done_with_crate_board:
-                crate_lines.append(line.replace('\n', ''))
-            else:
-                _num, _from, _to = map(int, parser_rawmove.search(line).groups())
-                move_list.append(Move(_num, _from, _to))
+        crate_board_9000 = read_crate_board(_inputfile)
+        # per crane: [crane, board, moves held back, number of moves applied]
+        cranes = [[cratemover_9000, crate_board_9000, deque(), 0], [cratemover_9001, crate_board_9000.copy(), deque(), 0]]
+        for move in iterate_moves(_inputfile):
+            num_moves += 1
+            for crane in cranes:
+                crane_move_fn, crate_board, pending_moves, _ = crane
+                push_optimized_move(pending_moves, move, CRANE_KEEPS_ORDER[crane_move_fn])
+                if len(pending_moves) > max_pending_moves:
+                    num_crates, pos_from, pos_to = pending_moves.popleft()
+                    crane_move_fn(crate_board, num_crates, pos_from - 1, pos_to - 1)
+                    crane[3] += 1
 
-    return crate_board, move_list
+    # end of the file -- the moves still held back can't fuse with anything else
+    for crane in cranes:
+        crane_move_fn, crate_board, pending_moves, _ = crane
+        for (num_crates, pos_from, pos_to) in pending_moves:
+            crane_move_fn(crate_board, num_crates, pos_from - 1, pos_to - 1)
+        crane[3] += len(pending_moves)
+    (_, crate_board_9000, _, num_applied_9000), (_, crate_board_9001, _, num_applied_9001) = cranes
+    return StreamingResult(crate_board_9000.top_crates(), crate_board_9001.top_crates(),
+                           num_moves - num_applied_9000, num_moves - num_applied_9001)
 
 def apply_move_list_and_print_solution(crate_board, move_list, crane_move_fn, printmoves):
+    '''Returns (final top crates, number of moves the move list optimizer removed -- 0 when printing the moves).'''
+    num_removed = 0
     if printmoves:
-        print('Starting position:')
-        print_crate_board(crate_board)
+        renderer = CrateBoardRenderer(crate_board)
+        renderer.render(header='Starting position:\n')
+    elif crane_move_fn in CRANE_KEEPS_ORDER:
+        # (when printing, every move in the original list is shown instead -- and other cranes' moves aren't known to fuse)
+        move_list, num_removed = optimize_move_list(move_list, crane_move_fn)
     # make all encoded moves
     for (num_crates, pos_from, pos_to) in move_list:
         idx_from = pos_from - 1
         idx_to   = pos_to   - 1
         crane_move_fn(crate_board, num_crates, idx_from, idx_to)
         if printmoves:
-            print(f"--- from {pos_from} to {pos_to}, {num_crates} crate{'s' if num_crates > 1 else ''}")
-            print_crate_board(crate_board)
+            renderer.render(touched_stacks=(idx_from, idx_to),
+                            header=f"--- from {pos_from} to {pos_to}, {num_crates} crate{'s' if num_crates > 1 else ''}\n")
     # finally, read out the top of each stack!
-    print(f"Final answer: {''.join(stack[-1] for stack in crate_board)}")
+    final_answer = crate_board.top_crates()
+    print(f"Final answer: {final_answer}")
+    return final_answer, num_removed
+
+# Both cranes move the whole group of crates with slice operations (one C-level copy per move, no matter how many crates).
+def cratemover_9000(crate_board, num_crates, idx_from, idx_to):
+    # one crate at a time -> the moved group lands in reverse order
+    if num_crates == 0:
+        return
+    stack_from = crate_board[idx_from]
+    crate_board[idx_to].extend(stack_from[:-num_crates - 1:-1])  # reversed slice -- still one C-level copy
+    del stack_from[-num_crates:]
+
+def cratemover_9001(crate_board, num_crates, idx_from, idx_to):
+    # all crates at once -> the moved group keeps its order
+    if num_crates == 0:
+        return
+    stack_from = crate_board[idx_from]
+    crate_board[idx_to].extend(stack_from[-num_crates:])
+    del stack_from[-num_crates:]
+
+# which cranes keep a moved group's order -- anything that reasons about moves without running the crane needs this
+CRANE_KEEPS_ORDER = {
+    cratemover_9000 : False,
+    cratemover_9001 : True,
+}
+
+def crane_keeps_order(crane_move_fn, keep_order=None):
+    '''keep_order if given, otherwise looked up for the known cranes -- a wrapped or custom crane has to say.'''
+    if keep_order is not None:
+        return keep_order
+    if crane_move_fn not in CRANE_KEEPS_ORDER:
+        raise ValueError(f'Unknown crane {crane_move_fn!r} -- pass keep_order explicitly')
+    return CRANE_KEEPS_ORDER[crane_move_fn]
+
+def is_noop_move(move):
+    return move.num_crates == 0 or move.pos_from == move.pos_to
+
+def fuse_moves(first, second, keep_order):
+    '''Single move equivalent to applying first then second, or None if the pair doesn't compose.
+    The fused move can have num_crates == 0, meaning the two moves cancel out.
+
+    Exact inverses cancel for both cranes: moving n crates there and back restores the n crates' order
+    (9001 keeps the order both ways, 9000 reverses it twice).
+    The CrateMover 9000 moves one crate at a time, so any two moves between the same pair of stacks compose:
+        same direction      a then b crates  ->  a + b crates
+        opposite direction  a then b crates  ->  the b crates moved back undo b of the a, leaving |a - b| net
+    The CrateMover 9001 doesn't compose beyond cancellation -- moving a then b crates in the same direction
+    stacks the two groups in the opposite order to a single move of a + b.
+    '''
+    if {first.pos_from, first.pos_to} != {second.pos_from, second.pos_to}:
+        return None
+    same_direction = first.pos_from == second.pos_from
+    if not same_direction and first.num_crates == second.num_crates:
+        return Move(0, first.pos_from, first.pos_to)
+    if keep_order:
+        return None
+    if same_direction:
+        return Move(first.num_crates + second.num_crates, first.pos_from, first.pos_to)
+    if first.num_crates > second.num_crates:
+        return Move(first.num_crates - second.num_crates, first.pos_from, first.pos_to)
+    return Move(second.num_crates - first.num_crates, second.pos_from, second.pos_to)
+
+def push_optimized_move(optimized_moves, move, keep_order):
+    '''One step of optimize_move_list(): appends move to optimized_moves (list or deque), fused with the moves at the end.'''
+    if is_noop_move(move):
+        return
+    while optimized_moves:
+        fused_move = fuse_moves(optimized_moves[-1], move, keep_order)
+        if fused_move is None:
+            break
+        optimized_moves.pop()
+        move = fused_move
+        if is_noop_move(move):
+            return
+    optimized_moves.append(move)
+
+def optimize_move_list(move_list, crane_move_fn, keep_order=None):
+    '''Preprocessing pass before execution: drops no-op moves, cancels exact inverses, and (CrateMover 9000)
+    fuses consecutive moves between the same pair of stacks.  Fusing cascades -- once two moves cancel, the move
+    before them gets a chance to fuse with the next one.
+    keep_order -- whether the crane keeps a moved group's order, see crane_keeps_order()
+    Returns (optimized move list, number of moves removed).
+    '''
+    keep_order = crane_keeps_order(crane_move_fn, keep_order)
+    optimized_move_list = []
+    for move in move_list:
+        push_optimized_move(optimized_move_list, move, keep_order)
+    return optimized_move_list, len(move_list) - len(optimized_move_list)
+
+def trace_top_crates(crate_board, move_list, crane_move_fn, keep_order=None):
+    '''Finds the final top crate of each stack without moving any crates -- O(moves x stacks), whatever the move sizes.
+
+    Follow each final top crate backwards through the move list, tracking (stack, depth from top):
+        - landed on the destination stack by this move (depth < num_crates)
+            -> it was in the source stack's top num_crates.  9001 keeps the group's order,
+               9000 moves crates one at a time so the group is reversed.
+        - on the destination stack, underneath the moved crates   -> num_crates shallower before the move
+        - on the source stack                                     -> num_crates deeper before the move
+    Once the first move is reached, the crate can be read off the initial board.
+    keep_order -- whether the crane keeps a moved group's order, see crane_keeps_order()
+    '''
+    keep_order = crane_keeps_order(crane_move_fn, keep_order)
+
+    # forward pass over the moves, tracking only stack heights -- needed to know which stacks end up empty
+    final_heights = [len(stack) for stack in crate_board]
+    for (num_crates, pos_from, pos_to) in move_list:
+        if pos_from != pos_to:
+            final_heights[pos_from - 1] -= num_crates
+            final_heights[pos_to - 1]   += num_crates
+
+    top_crates = ''
+    for idx, final_height in enumerate(final_heights):
+        if final_height == 0:
+            continue
+        stack_idx, depth = idx, 0
+        for (num_crates, pos_from, pos_to) in reversed(move_list):
+            idx_from = pos_from - 1
+            idx_to   = pos_to   - 1
+            if idx_from == idx_to:
+                continue
+            if stack_idx == idx_to:
+                if depth < num_crates:
+                    stack_idx = idx_from
+                    depth = depth if keep_order else num_crates - 1 - depth
+                else:
+                    depth -= num_crates
+            elif stack_idx == idx_from:
+                depth += num_crates
+        top_crates += chr(crate_board[stack_idx][-1 - depth])
+    return top_crates
+
+class MoveReplay:
+    '''Seekable replay of a move list.  While the moves are applied once up front, a compact snapshot of the board
+    (one immutable bytes object per stack) is recorded every checkpoint_interval moves.
+    board_at(move_index) then restores the nearest earlier snapshot and replays at most checkpoint_interval - 1 moves.
+    '''
+    def __init__(self, crate_board, move_list, crane_move_fn, checkpoint_interval=1000):
+        self.move_list = move_list
+        self.crane_move_fn = crane_move_fn
+        self.checkpoint_interval = checkpoint_interval
+
+        self.checkpoints = []
+        crate_board = crate_board.copy()
+        for move_index, (num_crates, pos_from, pos_to) in enumerate(move_list):
+            if move_index % checkpoint_interval == 0:
+                self.checkpoints.append(tuple(bytes(stack) for stack in crate_board))
+            crane_move_fn(crate_board, num_crates, pos_from - 1, pos_to - 1)
+        # board after the very last move, if it falls on a checkpoint (always true for an empty move list)
+        if len(move_list) % checkpoint_interval == 0:
+            self.checkpoints.append(tuple(bytes(stack) for stack in crate_board))
+
+    def __len__(self):
+        return len(self.move_list)
+
+    def board_at(self, move_index):
+        '''Board after the first move_index moves have been applied (0 = starting position).'''
+        if not 0 <= move_index <= len(self.move_list):
+            raise IndexError(f'move_index {move_index} out of range for {len(self.move_list)} moves')
+        checkpoint_idx = move_index // self.checkpoint_interval
+        crate_board = CrateBoard(self.checkpoints[checkpoint_idx])
+        for (num_crates, pos_from, pos_to) in self.move_list[checkpoint_idx * self.checkpoint_interval:move_index]:
+            self.crane_move_fn(crate_board, num_crates, pos_from - 1, pos_to - 1)
+        return crate_board
 
 def part_one(crate_board, move_list, printmoves):
-    def cratemover_9000(crate_board, num_crates, idx_from, idx_to):
-        for _ in range(num_crates):
-            crate = crate_board[idx_from].pop()
-            crate_board[idx_to].append(crate)
     print('part one')
-    apply_move_list_and_print_solution(crate_board, move_list, cratemover_9000, printmoves)
+    final_answer, _ = apply_move_list_and_print_solution(crate_board, move_list, cratemover_9000, printmoves)
+    return final_answer
 
 def part_two(crate_board, move_list, printmoves):
-    def cratemover_9001(crate_board, num_crates, idx_from, idx_to):
-        crane_arm_stack = []
-        for _ in range(num_crates):
-            crate = crate_board[idx_from].pop()
-            crane_arm_stack.append(crate)
-        for _ in range(num_crates):
-            crate = crane_arm_stack.pop()
-            crate_board[idx_to].append(crate)
     print('part two')
-    apply_move_list_and_print_solution(crate_board, move_list, cratemover_9001, printmoves)
+    final_answer, _ = apply_move_list_and_print_solution(crate_board, move_list, cratemover_9001, printmoves)
+    return final_answer
 
 if __name__ == '__main__':
     # need to open file and parse into crate gameboard and list of moves.
     for inputfile in ['example.txt', 'input.txt']:
         print(f'--- {inputfile}')
         printmoves = inputfile == 'example.txt'
-        crate_board, move_list = read_file(inputfile)
-        # need to deepcopy bc all the operations rely on mutability of lists (no return values)
-        part_one(copy.deepcopy(crate_board), move_list, printmoves)
-        part_two(copy.deepcopy(crate_board), move_list, printmoves)
+        if printmoves:
+            crate_board, move_list = read_file(inputfile)
+            # need to copy bc all the operations rely on mutability of the stacks (no return values)
+            part_one(crate_board.copy(), move_list, printmoves)
+            part_two(crate_board.copy(), move_list, printmoves)
+        else:
+            # nothing to print -> stream the moves, optimizing and applying them to both cranes' boards
+            result = apply_moves_streaming_both_cranes(inputfile)
+            print(f'part one\nMove list optimizer removed {result.num_removed_9000} moves\nFinal answer: {result.top_crates_9000}')
+            print(f'part two\nMove list optimizer removed {result.num_removed_9001} moves\nFinal answer: {result.top_crates_9001}')
 
 # '''
 # Notes  (after finishing part_one and reading over part_two requirements)
@@ -0,0 +1,277 @@
+# std library
+import contextlib
+import copy
+import io
+import random
+import unittest
+# local
+import solution
+
+# per-crate reference cranes (original implementation), used as the oracle for the bulk slice moves
+def reference_cratemover_9000(crate_board, num_crates, idx_from, idx_to):
+    for _ in range(num_crates):
+        crate_board[idx_to].append(crate_board[idx_from].pop())
+
+def reference_cratemover_9001(crate_board, num_crates, idx_from, idx_to):
+    crane_arm_stack = []
+    for _ in range(num_crates):
+        crane_arm_stack.append(crate_board[idx_from].pop())
+    for _ in range(num_crates):
+        crate_board[idx_to].append(crane_arm_stack.pop())
+
+class TestDay05(unittest.TestCase):
+
+    EXAMPLE = 'example.txt'
+    INPUT   = 'input.txt'
+
+    def solve(self, textfile, part_fn):
+        crate_board, move_list = solution.read_file(textfile)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return part_fn(crate_board, move_list, printmoves=False)
+
+    def test_answers(self):
+        for textfile, part_fn, answer in [(self.EXAMPLE, solution.part_one, 'CMZ'),
+                                          (self.EXAMPLE, solution.part_two, 'MCD'),
+                                          (self.INPUT, solution.part_one, 'FJSRQCFTN'),
+                                          (self.INPUT, solution.part_two, 'CJVLJQPHS')]:
+            with self.subTest(i=f'{textfile} {part_fn.__name__}'):
+                self.assertEqual(self.solve(textfile, part_fn), answer)
+
+    def test_bulk_moves_match_per_crate_moves(self):
+        rng = random.Random(5)
+        for crane_move_fn, reference_fn in [(solution.cratemover_9000, reference_cratemover_9000),
+                                            (solution.cratemover_9001, reference_cratemover_9001)]:
+            crate_board = [[chr(ord('A') + rng.randrange(26)) for _ in range(rng.randrange(30))] for _ in range(5)]
+            reference_board = copy.deepcopy(crate_board)
+            for move_num in range(500):
+                idx_from, idx_to = rng.sample(range(5), 2)
+                num_crates = rng.randint(0, len(crate_board[idx_from]))
+                crane_move_fn(crate_board, num_crates, idx_from, idx_to)
+                reference_fn(reference_board, num_crates, idx_from, idx_to)
+                with self.subTest(i=f'{crane_move_fn.__name__} move {move_num}'):
+                    self.assertEqual(crate_board, reference_board)
+
+    def test_crate_board(self):
+        crate_board, _ = solution.read_file(self.EXAMPLE)
+        self.assertEqual(crate_board, solution.CrateBoard([b'ZN', b'MCD', b'P']))
+        self.assertEqual(crate_board.top_crates(), 'NDP')
+        self.assertEqual(crate_board.crate(1, 2), 'D')
+        # copies don't share stacks
+        board_copy = crate_board.copy()
+        solution.cratemover_9001(board_copy, 2, 1, 2)
+        self.assertEqual(board_copy, solution.CrateBoard([b'ZN', b'M', b'PCD']))
+        self.assertEqual(crate_board, solution.CrateBoard([b'ZN', b'MCD', b'P']))
+
+    def test_bulk_moves_on_crate_board_match_lists(self):
+        rng = random.Random(9)
+        for crane_move_fn in (solution.cratemover_9000, solution.cratemover_9001):
+            list_board = [[chr(ord('A') + rng.randrange(26)) for _ in range(rng.randrange(30))] for _ in range(4)]
+            crate_board = solution.CrateBoard.from_crate_lists(list_board)
+            for _ in range(300):
+                idx_from, idx_to = rng.sample(range(4), 2)
+                num_crates = rng.randint(0, len(list_board[idx_from]))
+                crane_move_fn(list_board, num_crates, idx_from, idx_to)
+                crane_move_fn(crate_board, num_crates, idx_from, idx_to)
+            with self.subTest(i=crane_move_fn.__name__):
+                self.assertEqual(crate_board, solution.CrateBoard.from_crate_lists(list_board))
+
+    def test_print_crate_board(self):
+        crate_board, _ = solution.read_file(self.EXAMPLE)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            solution.print_crate_board(crate_board)
+        with open(self.EXAMPLE, 'r') as exfile:
+            board_lines = exfile.read().split('\n\n')[0].split('\n')
+        # printout puts a space after every stack, so each crate row is one character wider than the file's
+        self.assertEqual(out.getvalue().split('\n')[:-1], [line + ' ' for line in board_lines[:-1]] + [board_lines[-1]])
+
+    def test_trace_top_crates(self):
+        for textfile, crane_move_fn, answer in [(self.EXAMPLE, solution.cratemover_9000, 'CMZ'),
+                                                (self.EXAMPLE, solution.cratemover_9001, 'MCD'),
+                                                (self.INPUT, solution.cratemover_9000, 'FJSRQCFTN'),
+                                                (self.INPUT, solution.cratemover_9001, 'CJVLJQPHS')]:
+            crate_board, move_list = solution.read_file(textfile)
+            with self.subTest(i=f'{textfile} {crane_move_fn.__name__}'):
+                self.assertEqual(solution.trace_top_crates(crate_board, move_list, crane_move_fn), answer)
+            # tracing doesn't touch the board
+            self.assertEqual(crate_board, solution.read_file(textfile)[0])
+
+    def test_trace_top_crates_random_moves(self):
+        rng = random.Random(20)
+        for crane_move_fn in (solution.cratemover_9000, solution.cratemover_9001):
+            for trial in range(20):
+                crate_board = solution.CrateBoard(bytes(rng.choice(b'ABCDEFGHIJ') for _ in range(rng.randrange(8))) for _ in range(4))
+                # moves between random stacks (including a stack to itself), possibly emptying stacks
+                board = crate_board.copy()
+                move_list = []
+                for _ in range(40):
+                    idx_from, idx_to = rng.randrange(4), rng.randrange(4)
+                    num_crates = rng.randint(0, len(board[idx_from]))
+                    move_list.append(solution.Move(num_crates, idx_from + 1, idx_to + 1))
+                    if idx_from != idx_to:
+                        crane_move_fn(board, num_crates, idx_from, idx_to)
+                with self.subTest(i=f'{crane_move_fn.__name__} trial {trial}'):
+                    self.assertEqual(solution.trace_top_crates(crate_board, move_list, crane_move_fn), board.top_crates())
+
+    def test_trace_top_crates_unknown_crane(self):
+        crate_board, move_list = solution.read_file(self.EXAMPLE)
+        wrapped_9001 = lambda *args: solution.cratemover_9001(*args)
+        with self.assertRaises(ValueError):
+            solution.trace_top_crates(crate_board, move_list, wrapped_9001)
+        self.assertEqual(solution.trace_top_crates(crate_board, move_list, wrapped_9001, keep_order=True), 'MCD')
+
+    def test_move_replay(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            crate_board, move_list = solution.read_file(textfile)
+            for crane_move_fn in (solution.cratemover_9000, solution.cratemover_9001):
+                # every board along the way, applying one move at a time
+                boards = [crate_board.copy()]
+                for (num_crates, pos_from, pos_to) in move_list:
+                    boards.append(boards[-1].copy())
+                    crane_move_fn(boards[-1], num_crates, pos_from - 1, pos_to - 1)
+                for checkpoint_interval in (1, 2, 7, 100, 1000):
+                    replay = solution.MoveReplay(crate_board, move_list, crane_move_fn, checkpoint_interval)
+                    with self.subTest(i=f'{textfile} {crane_move_fn.__name__} every {checkpoint_interval}'):
+                        self.assertEqual([replay.board_at(i) for i in range(len(move_list) + 1)], boards)
+                        with self.assertRaises(IndexError):
+                            replay.board_at(len(move_list) + 1)
+
+    def verify_optimized_move_list(self, crate_board, move_list, crane_move_fn):
+        optimized_move_list, num_removed = solution.optimize_move_list(move_list, crane_move_fn)
+        self.assertEqual(num_removed, len(move_list) - len(optimized_move_list))
+        boards = [crate_board.copy(), crate_board.copy()]
+        for board, moves in zip(boards, [move_list, optimized_move_list]):
+            for (num_crates, pos_from, pos_to) in moves:
+                crane_move_fn(board, num_crates, pos_from - 1, pos_to - 1)
+        self.assertEqual(boards[0], boards[1])
+        return optimized_move_list
+
+    def test_optimize_move_list(self):
+        Move = solution.Move
+        crate_board = solution.CrateBoard([b'ABCDE', b'FGH', b'IJ'])
+        move_list = [Move(0, 1, 2), Move(2, 1, 2), Move(2, 2, 1), Move(1, 3, 3),   # no-op, inverse pair, no-op
+                     Move(1, 1, 3), Move(2, 1, 3), Move(1, 3, 1),                   # 9000: fuses to Move(2, 1, 3)
+                     Move(1, 2, 3)]
+        with self.subTest(i='cratemover_9000'):
+            optimized_move_list = self.verify_optimized_move_list(crate_board, move_list, solution.cratemover_9000)
+            self.assertEqual(optimized_move_list, [Move(2, 1, 3), Move(1, 2, 3)])
+        with self.subTest(i='cratemover_9001'):
+            optimized_move_list = self.verify_optimized_move_list(crate_board, move_list, solution.cratemover_9001)
+            self.assertEqual(optimized_move_list, [Move(1, 1, 3), Move(2, 1, 3), Move(1, 3, 1), Move(1, 2, 3)])
+
+    def test_optimize_move_list_unknown_crane(self):
+        Move = solution.Move
+        move_list = [Move(1, 1, 2), Move(1, 1, 2)]  # fuses for the 9000, but not for an order-keeping crane
+        wrapped_9001 = lambda *args: solution.cratemover_9001(*args)
+        with self.assertRaises(ValueError):
+            solution.optimize_move_list(move_list, wrapped_9001)
+        self.assertEqual(solution.optimize_move_list(move_list, wrapped_9001, keep_order=True), (move_list, 0))
+        # unknown cranes still run, just without the optimizer
+        with contextlib.redirect_stdout(io.StringIO()):
+            answer, num_removed = solution.apply_move_list_and_print_solution(solution.CrateBoard([b'AB', b'']), move_list, wrapped_9001, printmoves=False)
+        self.assertEqual((answer, num_removed), ('A', 0))
+
+    def test_apply_move_list_reports_removed_moves(self):
+        Move = solution.Move
+        move_list = [Move(1, 1, 2), Move(1, 2, 1), Move(1, 1, 2)]  # inverse pair, then one real move
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            answer, num_removed = solution.apply_move_list_and_print_solution(solution.CrateBoard([b'AB', b'C']), move_list, solution.cratemover_9000, printmoves=False)
+        self.assertEqual((answer, num_removed), ('AB', 2))
+        self.assertEqual(out.getvalue(), 'Final answer: AB\n')
+
+    def test_optimize_move_list_random_redundant_runs(self):
+        rng = random.Random(22)
+        for crane_move_fn in (solution.cratemover_9000, solution.cratemover_9001):
+            for trial in range(30):
+                crate_board = solution.CrateBoard(bytes(rng.choice(b'ABCDEFGHIJ') for _ in range(rng.randrange(10))) for _ in range(3))
+                board = crate_board.copy()
+                move_list = []
+                for _ in range(60):
+                    # few stacks + frequent back-and-forth -> lots of fusable / cancelling runs
+                    if move_list and rng.random() < 0.4:
+                        pos_from, pos_to = (move_list[-1].pos_to, move_list[-1].pos_from) if rng.random() < 0.5 else (move_list[-1].pos_from, move_list[-1].pos_to)
+                    else:
+                        pos_from, pos_to = rng.randint(1, 3), rng.randint(1, 3)
+                    num_crates = rng.randint(0, len(board[pos_from - 1]))
+                    move_list.append(solution.Move(num_crates, pos_from, pos_to))
+                    crane_move_fn(board, num_crates, pos_from - 1, pos_to - 1)
+                with self.subTest(i=f'{crane_move_fn.__name__} trial {trial}'):
+                    self.verify_optimized_move_list(crate_board, move_list, crane_move_fn)
+
+    def test_optimize_input_move_list(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            crate_board, move_list = solution.read_file(textfile)
+            for crane_move_fn in (solution.cratemover_9000, solution.cratemover_9001):
+                with self.subTest(i=f'{textfile} {crane_move_fn.__name__}'):
+                    self.verify_optimized_move_list(crate_board, move_list, crane_move_fn)
+
+    def test_renderer_matches_print_crate_board(self):
+        for textfile in [self.EXAMPLE, self.INPUT]:
+            crate_board, move_list = solution.read_file(textfile)
+            renderer = solution.CrateBoardRenderer(crate_board, output=io.StringIO())
+            # starting position (Move(0, 1, 1) changes nothing), then the first 100 moves
+            for move_num, (num_crates, pos_from, pos_to) in enumerate([solution.Move(0, 1, 1)] + move_list[:100]):
+                solution.cratemover_9001(crate_board, num_crates, pos_from - 1, pos_to - 1)
+                renderer.update((pos_from - 1, pos_to - 1))
+                with contextlib.redirect_stdout(io.StringIO()) as out:
+                    solution.print_crate_board(crate_board)
+                with self.subTest(i=f'{textfile} move {move_num}'):
+                    self.assertEqual(renderer.frame(), out.getvalue())
+
+    def test_renderer_single_write_per_frame(self):
+        class CountingWriter(io.StringIO):
+            num_writes = 0
+            def write(self, string):
+                self.num_writes += 1
+                return super().write(string)
+        crate_board, _ = solution.read_file(self.EXAMPLE)
+        output = CountingWriter()
+        renderer = solution.CrateBoardRenderer(crate_board, output=output)
+        renderer.render(header='Starting position:\n')
+        solution.cratemover_9000(crate_board, 1, 1, 0)
+        renderer.render(touched_stacks=(1, 0), header='--- from 2 to 1, 1 crate\n')
+        self.assertEqual(output.num_writes, 2)
+        self.assertEqual(output.getvalue(),
+"""Starting position:
+    [D]     
+[N] [C]     
+[Z] [M] [P] 
+ 1   2   3 
+--- from 2 to 1, 1 crate
+[D]         
+[N] [C]     
+[Z] [M] [P] 
+ 1   2   3 
+""")
+
+    def test_streaming_both_cranes(self):
+        for textfile, answers in [(self.EXAMPLE, ('CMZ', 'MCD')), (self.INPUT, ('FJSRQCFTN', 'CJVLJQPHS'))]:
+            with self.subTest(i=textfile):
+                result = solution.apply_moves_streaming_both_cranes(textfile)
+                self.assertEqual((result.top_crates_9000, result.top_crates_9001), answers)
+
+    def test_streaming_both_cranes_optimizes_moves(self):
+        _, move_list = solution.read_file(self.INPUT)
+        num_removed_9000 = solution.optimize_move_list(move_list, solution.cratemover_9000)[1]
+        num_removed_9001 = solution.optimize_move_list(move_list, solution.cratemover_9001)[1]
+        self.assertGreater(num_removed_9000, 0)
+        result = solution.apply_moves_streaming_both_cranes(self.INPUT)
+        self.assertEqual(result, ('FJSRQCFTN', 'CJVLJQPHS', num_removed_9000, num_removed_9001))
+        # holding back fewer moves can only miss fusions, never change the answers
+        for max_pending_moves in (0, 1, 2, 5):
+            with self.subTest(i=max_pending_moves):
+                result = solution.apply_moves_streaming_both_cranes(self.INPUT, max_pending_moves)
+                self.assertEqual(result[:2], ('FJSRQCFTN', 'CJVLJQPHS'))
+                self.assertLessEqual(result.num_removed_9000, num_removed_9000)
+
+    def test_iterate_moves_is_lazy(self):
+        with open(self.INPUT, 'r') as inputfile:
+            solution.read_crate_board(inputfile)
+            moves = solution.iterate_moves(inputfile)
+            first_move = next(moves)
+            self.assertEqual(first_move, solution.read_file(self.INPUT)[1][0])
+            # the remaining moves keep coming from the same open file
+            self.assertGreater(sum(1 for _ in moves), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+# std library
+import random
+import sys
+import time
+# local
+import solution
+
+'''
+Times the deque + set() detector against the O(1)-per-character detector on large generated datastreams.
+
+    python benchmark.py [size in Mi characters]    (default: 1)
+
+Each stream is drawn from an alphabet of n - 1 symbols, so no window of n is unique until the n distinct
+symbols appended at the very end -- both detectors have to scan the whole buffer.
+'''
+
+DEFAULT_SIZE_MB = 1
+WINDOW_SIZES = (4, 14, 64, 256, 400)
+
+def generate_datastream(size_mb, n, seed=2022):
+    rng = random.Random(seed)
+    alphabet = [chr(0x100 + i) for i in range(n)]  # past latin-1 so window sizes aren't capped by letters
+    size = size_mb * (1 << 20)
+    return ''.join(rng.choices(alphabet[:-1], k=size)) + ''.join(alphabet)
+
+def time_fn(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE_MB
+    for n in WINDOW_SIZES:
+        datastream = generate_datastream(size_mb, n)
+        print(f'--- {size_mb} Mi characters, window size {n}')
+        for name, fn in [('deque + set()', solution.process_datastream_and_find_first_n_consecutive_unique_characters),
+                         ('last-seen skip-ahead', solution.find_first_n_consecutive_unique_characters)]:
+            result, elapsed = time_fn(fn, datastream, n)
+            print(f'{name:>22}: {elapsed:8.2f} s   {size_mb / elapsed:8.1f} M chars/s   marker: {result}')
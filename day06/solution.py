@@ -11,11 +11,26 @@ def process_datastream_and_find_first_n_consecutive_unique_characters(datastream
         if len(set(last_n_chars)) == n:
             return index
 
+def find_first_n_consecutive_unique_characters(datastream, n):
+    '''Same answer as above in O(1) per character, whatever n is -- works on str or bytes.
+    last_seen[char] is the index where char was last seen.  The window always starts just after the most recent
+    repeated character, so a repeat only ever moves window_start forward and nothing is rebuilt per character.
+    '''
+    last_seen = {}
+    window_start = 0
+    for index, char in enumerate(datastream):
+        previous_index = last_seen.get(char, -1)
+        if previous_index >= window_start:
+            window_start = previous_index + 1
+        last_seen[char] = index
+        if index - window_start + 1 == n:
+            return index + 1
+
 def part_one__find_first_packet_start_marker(datastream):
-    return process_datastream_and_find_first_n_consecutive_unique_characters(datastream, n=4)
+    return find_first_n_consecutive_unique_characters(datastream, n=4)
 
 def part_two__find_first_message_start_marker(datastream):
-    return process_datastream_and_find_first_n_consecutive_unique_characters(datastream, n=14)
+    return find_first_n_consecutive_unique_characters(datastream, n=14)
 
 if __name__ == '__main__':
     filelist = [f'example_{i}.txt' for i in range(1, 6)] + ['input.txt']
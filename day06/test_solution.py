@@ -0,0 +1,49 @@
+# std library
+import random
+import unittest
+# local
+import solution
+
+class TestDay06(unittest.TestCase):
+
+    # file -> (packet marker, message marker)
+    EXPECTED = {
+        'example_1.txt' : (7, 19),
+        'example_2.txt' : (5, 23),
+        'example_3.txt' : (6, 23),
+        'example_4.txt' : (10, 29),
+        'example_5.txt' : (11, 26),
+        'input.txt'     : (1042, 2980),
+    }
+
+    def read(self, textfile):
+        with open(textfile) as datastream:
+            return datastream.read()
+
+    def test_markers(self):
+        for textfile, (packet_marker, message_marker) in self.EXPECTED.items():
+            with self.subTest(textfile=textfile):
+                datastream = self.read(textfile)
+                self.assertEqual(solution.part_one__find_first_packet_start_marker(datastream), packet_marker)
+                self.assertEqual(solution.part_two__find_first_message_start_marker(datastream), message_marker)
+
+    def test_bytes_datastream(self):
+        datastream = self.read('input.txt').encode()
+        self.assertEqual(solution.find_first_n_consecutive_unique_characters(datastream, 14), 2980)
+
+    def test_no_marker(self):
+        self.assertIsNone(solution.find_first_n_consecutive_unique_characters('abcabcabc', 4))
+        self.assertIsNone(solution.find_first_n_consecutive_unique_characters('', 4))
+
+    def test_matches_original_on_random_streams(self):
+        rng = random.Random(2022)
+        for _ in range(200):
+            alphabet_size = rng.randint(1, 30)
+            n = rng.randint(1, 40)
+            datastream = ''.join(chr(ord('a') + rng.randrange(alphabet_size)) for _ in range(rng.randint(0, 300)))
+            with self.subTest(datastream=datastream, n=n):
+                self.assertEqual(solution.find_first_n_consecutive_unique_characters(datastream, n),
+                                 solution.process_datastream_and_find_first_n_consecutive_unique_characters(datastream, n))
+
+if __name__ == '__main__':
+    unittest.main()